@@ -2,11 +2,15 @@
 """Django's command-line utility for administrative tasks."""
 import os
 import sys
+from pathlib import Path
 
 
 def main():
     """Run administrative tasks."""
     os.environ.setdefault("DJANGO_SETTINGS_MODULE", "scrimverse.settings")
+    # Done here (and in wsgi.py/celery.py) instead of settings.py so plain
+    # settings imports don't pay the syscall
+    (Path(__file__).resolve().parent / "logs").mkdir(exist_ok=True)
     try:
         from django.core.management import execute_from_command_line
     except ImportError as exc:
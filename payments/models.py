@@ -138,13 +138,23 @@ class Payment(models.Model):
         return f"{self.merchant_order_id} - {self.payment_type} - ₹{self.amount}"
 
     def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+
         # Auto-calculate amount in paisa
         if self.amount:
             self.amount_paisa = int(self.amount * 100)
+            if update_fields is not None and "amount" in update_fields:
+                update_fields = {*update_fields, "amount_paisa"}
 
         # Set completed_at when status changes to completed
         if self.status == "completed" and not self.completed_at:
             self.completed_at = timezone.now()
+            if update_fields is not None:
+                update_fields = {*update_fields, "completed_at"}
+
+        # Keep auto_now column in sync on targeted updates
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "updated_at"}
 
         super().save(*args, **kwargs)
 
@@ -204,13 +214,23 @@ class Refund(models.Model):
         return f"Refund {self.merchant_refund_id} - ₹{self.amount}"
 
     def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+
         # Auto-calculate amount in paisa
         if self.amount:
             self.amount_paisa = int(self.amount * 100)
+            if update_fields is not None and "amount" in update_fields:
+                update_fields = {*update_fields, "amount_paisa"}
 
         # Set completed_at when status changes to completed
         if self.status == "completed" and not self.completed_at:
             self.completed_at = timezone.now()
+            if update_fields is not None:
+                update_fields = {*update_fields, "completed_at"}
+
+        # Keep auto_now column in sync on targeted updates
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "updated_at"}
 
         super().save(*args, **kwargs)
 
@@ -41,6 +41,10 @@ from tournaments.tasks import (
 
 logger = logging.getLogger(__name__)
 
+# Static config read once at import instead of per webhook call
+_CALLBACK_USERNAME = config("PHONEPE_CALLBACK_USERNAME", default="")
+_CALLBACK_PASSWORD = config("PHONEPE_CALLBACK_PASSWORD", default="")
+
 
 def convert_to_dict(obj):
     """
@@ -54,6 +58,11 @@ def convert_to_dict(obj):
         return {k: convert_to_dict(v) for k, v in obj.items()}
     elif isinstance(obj, (list, tuple)):
         return [convert_to_dict(item) for item in obj]
+    elif hasattr(obj, "to_dict"):
+        # PhonePe SDK models are dataclasses-json objects; their own serializer
+        # already produces JSON-ready dicts, so skip the attribute-by-attribute
+        # __dict__ copy (which also drags in private attrs)
+        return obj.to_dict()
     elif hasattr(obj, "__dict__"):
         return {k: convert_to_dict(v) for k, v in obj.__dict__.items()}
     else:
@@ -172,7 +181,7 @@ def initiate_payment(request):
             if not phonepe_response.get("success"):
                 payment.status = "failed"
                 payment.error_code = phonepe_response.get("error_code", "")
-                payment.save()
+                payment.save(update_fields=["status", "error_code"])
 
                 return Response(
                     {"error": "Failed to initiate payment", "details": phonepe_response.get("error")},
@@ -182,7 +191,7 @@ def initiate_payment(request):
             # Update payment with PhonePe response
             payment.phonepe_order_id = phonepe_response.get("order_id")
             payment.redirect_url = phonepe_response.get("redirect_url")
-            payment.save()
+            payment.save(update_fields=["phonepe_order_id", "redirect_url"])
 
             logger.info(f"Payment initiated: {merchant_order_id} for user {user.username}")
 
@@ -308,7 +317,7 @@ def check_payment_status(request):
                             # Ensure link exists and is saved
                             if not payment.tournament:
                                 payment.tournament = tournament
-                                payment.save()
+                                payment.save(update_fields=["tournament"])
 
                             logger.info(f"Tournament linked to payment check: {tournament.id}")
 
@@ -335,7 +344,7 @@ def check_payment_status(request):
 
                             # Clear tournament_data from meta_info (no longer needed)
                             payment.meta_info.pop("tournament_data", None)
-                            payment.save()
+                            payment.save(update_fields=["meta_info"])
 
                             # Invalidate caches
                             cache.delete("tournaments:list:all")
@@ -356,7 +365,7 @@ def check_payment_status(request):
 
                                 # Ensure links in payment
                                 payment.registration = registration
-                                payment.save()
+                                payment.save(update_fields=["registration"])
 
                                 # Small success notification
                                 cache.delete("tournaments:list:all")
@@ -434,7 +443,7 @@ def check_payment_status(request):
                             # Ensure link exists
                             if not payment.registration:
                                 payment.registration = registration
-                                payment.save()
+                                payment.save(update_fields=["registration"])
 
                             logger.info(f"Registration linked to payment: {registration.id}")
 
@@ -498,7 +507,7 @@ def check_payment_status(request):
 
                             # Clear registration_data from meta_info (no longer needed)
                             payment.meta_info.pop("registration_data", None)
-                            payment.save()
+                            payment.save(update_fields=["meta_info"])
 
                             # Invalidate caches
                             cache.delete("tournaments:list:all")
@@ -520,7 +529,17 @@ def check_payment_status(request):
                 "detailed_error_code": phonepe_response.get("detailed_error_code"),
                 "payment_details": payment_details_list,
             }
-            payment.save()
+            payment.save(
+                update_fields=[
+                    "status",
+                    "phonepe_transaction_id",
+                    "payment_mode",
+                    "instrument_type",
+                    "error_code",
+                    "detailed_error_code",
+                    "callback_data",
+                ]
+            )
 
         logger.info(f"Payment status checked: {merchant_order_id} - Status: {payment.status}")
 
@@ -618,7 +637,7 @@ def initiate_refund(request):
             if not phonepe_response.get("success"):
                 refund.status = "failed"
                 refund.error_code = phonepe_response.get("error_code", "")
-                refund.save()
+                refund.save(update_fields=["status", "error_code"])
 
                 return Response(
                     {"error": "Failed to initiate refund", "details": phonepe_response.get("error")},
@@ -629,7 +648,7 @@ def initiate_refund(request):
             refund.phonepe_refund_id = phonepe_response.get("refund_id")
             refund.status = phonepe_response.get("state", "pending").lower()
             refund.callback_data = phonepe_response
-            refund.save()
+            refund.save(update_fields=["phonepe_refund_id", "status", "callback_data"])
 
             logger.info(f"Refund initiated: {merchant_refund_id} for payment {payment.merchant_order_id}")
 
@@ -651,6 +670,369 @@ def initiate_refund(request):
         return Response({"error": "Internal server error"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+def _handle_payment_callback(event_type, payload, callback_data):
+    """Apply a checkout.order.* webhook to the matching Payment row"""
+    merchant_order_id = payload.get("merchantOrderId", "")
+    logger.info(f"Processing payment callback for order: {merchant_order_id}")
+
+    try:
+        payment = Payment.objects.get(merchant_order_id=merchant_order_id)
+        logger.info(f"Found payment: {payment.id}, Type: {payment.payment_type}, Status: {payment.status}")
+
+        if event_type == "checkout.order.completed":
+            payment.status = "completed"
+            logger.info("Payment marked as completed")
+
+            # Create tournament/registration from meta_info
+            if payment.payment_type in ["tournament_plan", "scrim_plan"]:
+                logger.info("Processing tournament/scrim creation")
+                # Get tournament data from meta_info (stored separately, not in udf3)
+                tournament_data = payment.meta_info.get("tournament_data", {})
+                logger.info(f"Tournament data found: {bool(tournament_data)}")
+                logger.info(
+                    f"Tournament data keys: {list(tournament_data.keys()) if tournament_data else 'None'}"
+                )
+
+                if tournament_data:
+                    host_id = tournament_data.pop("host_id", None)
+                    logger.info(f"Host ID: {host_id}")
+
+                    # Convert datetime strings back to datetime objects
+                    datetime_fields = [
+                        "registration_start",
+                        "registration_end",
+                        "tournament_start",
+                        "tournament_end",
+                    ]
+                    for field in datetime_fields:
+                        if field in tournament_data and isinstance(tournament_data[field], str):
+                            tournament_data[field] = datetime.fromisoformat(tournament_data[field])
+
+                    # Convert date strings
+                    if "tournament_date" in tournament_data and isinstance(
+                        tournament_data["tournament_date"], str
+                    ):
+                        tournament_data["tournament_date"] = datetime.fromisoformat(
+                            tournament_data["tournament_date"]
+                        ).date()
+
+                    # Convert time strings
+                    if "tournament_time" in tournament_data and isinstance(
+                        tournament_data["tournament_time"], str
+                    ):
+                        hour, minute, second = tournament_data["tournament_time"].split(":")
+                        tournament_data["tournament_time"] = time(
+                            int(hour), int(minute), int(float(second))
+                        )
+
+                    # Convert numeric fields back to Decimal
+                    decimal_fields = ["entry_fee", "prize_pool", "plan_price"]
+                    for field in decimal_fields:
+                        if field in tournament_data and not isinstance(tournament_data[field], Decimal):
+                            tournament_data[field] = Decimal(str(tournament_data[field]))
+
+                    if host_id:
+                        logger.info(f"Creating tournament with data: {list(tournament_data.keys())}")
+
+                        # IDEMPOTENCY CHECK: Check if tournament already exists for this order
+                        tournament = Tournament.objects.filter(plan_payment_id=merchant_order_id).first()
+
+                        if not tournament:
+                            # Remove fields that we're setting explicitly to avoid duplicates
+                            tournament_data.pop("plan_payment_status", None)
+
+                            host = HostProfile.objects.get(id=host_id)
+                            tournament = Tournament.objects.create(
+                                host=host,
+                                plan_payment_status=True,
+                                plan_payment_id=merchant_order_id,
+                                **tournament_data,
+                            )
+                            logger.info(
+                                f"✅ Tournament created successfully: {tournament.id} - {tournament.title}"
+                            )
+                        else:
+                            logger.info(f"Tournament already exists for order: {merchant_order_id}")
+
+                        # Link payment to tournament
+                        payment.tournament = tournament
+
+                        logger.info(f"Tournament linked from webhook: {tournament.id} - {tournament.title}")
+
+                        # 📧 SEND TOURNAMENT CREATED EMAIL TO HOST
+                        frontend_url = settings.FRONTEND_BASE_URL
+                        tournament_url = f"{frontend_url}/tournaments/{tournament.id}"
+                        tournament_manage_url = f"{frontend_url}/host/tournaments/{tournament.id}/manage"
+                        start_date = tournament.tournament_start.strftime("%B %d, %Y at %I:%M %p")
+                        event_type = "Scrim" if tournament.event_mode == "SCRIM" else "Tournament"
+
+                        send_tournament_created_email_task.delay(
+                            host_email=host.user.email,
+                            host_name=host.user.username,
+                            tournament_name=tournament.title,
+                            game_name=tournament.game_name,
+                            start_date=start_date,
+                            max_participants=tournament.max_participants,
+                            plan_type=f"{tournament.plan_type} - {event_type}",
+                            tournament_url=tournament_url,
+                            tournament_manage_url=tournament_manage_url,
+                        )
+
+                        logger.info(
+                            f"Tournament created email sent from webhook to host: {host.user.email}"
+                        )
+
+                        # Clear tournament_data from meta_info (no longer needed and contains Decimals)
+                        payment.meta_info.pop("tournament_data", None)
+
+                    # Invalidate caches
+                    cache.delete("tournaments:list:all")
+                    cache.delete(f"host:dashboard:{host.id}")
+
+            elif payment.payment_type == "entry_fee":
+                # ===== INVITE-BASED FLOW (NEW) =====
+                registration_id = payment.meta_info.get("udf4")
+                if registration_id:
+                    try:
+                        registration = TournamentRegistration.objects.get(id=int(registration_id))
+                        if registration.temp_teammate_emails:
+                            result = process_successful_registration(registration, merchant_order_id)
+                            logger.info(f"✅ Invite-based registration processed from webhook: {registration.id}")
+
+                            payment.registration = registration
+                            cache.delete("tournaments:list:all")
+                            cache.delete(f"host:dashboard:{registration.tournament.host.id}")
+                    except TournamentRegistration.DoesNotExist:
+                        logger.warning(f"Registration {registration_id} not found for invite-flow (webhook)")
+                    except Exception as e:
+                        logger.error(f"Error processing invite-based registration (webhook): {str(e)}")
+
+                # ===== LEGACY FLOW (OLD) =====
+                # Get registration data from meta_info (stored separately, not in udf3)
+                # Initialize legacy variables to avoid UnboundLocalError when reg_data is empty
+                tournament_id = None
+                player_id = None
+                team_id = None
+                player_usernames = []
+                team_name = ""
+                save_as_team = False
+
+                reg_data = payment.meta_info.get("registration_data", {})
+                if reg_data:
+                    tournament_id = reg_data.pop("tournament_id", None)
+                    player_id = reg_data.pop("player_id", None)
+                    team_id = reg_data.pop("team_id", None)
+                    player_usernames = reg_data.pop("player_usernames", [])
+                    team_name = reg_data.pop("team_name", "")
+                    save_as_team = reg_data.pop("save_as_team", False)
+
+                if tournament_id and player_id:
+                    tournament = Tournament.objects.get(id=tournament_id)
+                    player = PlayerProfile.objects.get(id=player_id)
+
+                    # Create team if needed
+                    team_instance = None
+                    if team_id:
+                        team_instance = Team.objects.get(id=team_id)
+                    elif save_as_team:
+                        team_instance = Team.objects.create(name=team_name, captain=player.user)
+                        for username in player_usernames:
+                            user_obj = User.objects.filter(username=username, user_type="player").first()
+                            is_cap = username == player.user.username
+                            TeamMember.objects.create(
+                                team=team_instance, username=username, user=user_obj, is_captain=is_cap
+                            )
+                    else:
+                        team_instance = Team.objects.create(
+                            name=team_name, captain=player.user, is_temporary=True
+                        )
+
+                    # Prepare team members data
+                    team_members_data = []
+                    for username in player_usernames:
+                        user_obj = User.objects.filter(username=username, user_type="player").first()
+                        team_members_data.append(
+                            {
+                                "username": username,
+                                "is_registered": user_obj is not None,
+                                "player_id": user_obj.player_profile.id
+                                if user_obj and hasattr(user_obj, "player_profile")
+                                else None,
+                            }
+                        )
+
+                    # Create registration
+                    # IDEMPOTENCY CHECK: Check if registration already exists
+                    registration = TournamentRegistration.objects.filter(
+                        payment_id=merchant_order_id
+                    ).first()
+
+                    if not registration:
+                        registration = TournamentRegistration.objects.create(
+                            tournament=tournament,
+                            player=player,
+                            team=team_instance,
+                            team_name=team_name,
+                            team_members=team_members_data,
+                            payment_status=True,
+                            payment_id=merchant_order_id,
+                            **reg_data,
+                        )
+
+                        # Update participant count
+                        tournament.current_participants += 1
+                        tournament.save()
+                        logger.info(f"Registration created from webhook: {registration.id}")
+                    else:
+                        logger.info(f"Registration already exists for order: {merchant_order_id}")
+
+                    # Link payment to registration
+                    payment.registration = registration
+                    logger.info(f"Registration linked from webhook: {registration.id}")
+
+                    # 📧 SEND REGISTRATION SUCCESS EMAIL TO ALL TEAM MEMBERS
+                    frontend_url = settings.FRONTEND_BASE_URL
+                    tournament_url = f"{frontend_url}/tournaments/{tournament.id}"
+                    start_date = tournament.tournament_start.strftime("%B %d, %Y at %I:%M %p")
+
+                    # Send to captain
+                    send_tournament_registration_email_task.delay(
+                        user_email=player.user.email,
+                        user_name=player.user.username,
+                        tournament_name=tournament.tournament_name,
+                        game_name=tournament.game,
+                        start_date=start_date,
+                        registration_id=str(registration.id),
+                        tournament_url=tournament_url,
+                        team_name=team_name,
+                    )
+
+                    # Send to all team members
+                    for member_data in team_members_data:
+                        if member_data.get("is_registered") and member_data.get("player_id"):
+                            try:
+                                member_player = PlayerProfile.objects.get(id=member_data["player_id"])
+                                send_tournament_registration_email_task.delay(
+                                    user_email=member_player.user.email,
+                                    user_name=member_player.user.username,
+                                    tournament_name=tournament.tournament_name,
+                                    game_name=tournament.game,
+                                    start_date=start_date,
+                                    registration_id=str(registration.id),
+                                    tournament_url=tournament_url,
+                                    team_name=team_name,
+                                )
+                            except PlayerProfile.DoesNotExist:
+                                pass
+
+                    logger.info(
+                        f"Registration emails queued from webhook for {len(team_members_data) + 1} players"
+                    )
+
+                    # 📧 CHECK IF TOURNAMENT IS FULL - SEND SLOTS FILLED EMAIL TO HOST
+                    registration_count = TournamentRegistration.objects.filter(
+                        tournament=tournament, status="confirmed"
+                    ).count()
+
+                    if registration_count >= tournament.max_participants:
+                        send_registration_limit_reached_email_task.delay(
+                            host_email=tournament.host.user.email,
+                            host_name=tournament.host.user.username,
+                            tournament_name=tournament.tournament_name,
+                            total_registrations=registration_count,
+                            max_participants=tournament.max_participants,
+                            start_date=tournament.tournament_start.strftime("%B %d, %Y"),
+                            tournament_manage_url=f"{frontend_url}/host/tournaments/{tournament.id}/manage",
+                        )
+                        logger.info(
+                            f"Slots filled email sent from webhook to host: {tournament.host.user.email}"
+                        )
+
+                    # Clear registration_data from meta_info (no longer needed)
+                    payment.meta_info.pop("registration_data", None)
+                    payment.save(update_fields=["registration", "meta_info"])
+
+                    # Invalidate caches
+                    cache.delete("tournaments:list:all")
+                    cache.delete(f"host:dashboard:{tournament.host.id}")
+
+        else:  # FAILED
+            payment.status = "failed"
+            payment.error_code = payload.get("errorCode", "")
+            payment.detailed_error_code = payload.get("detailedErrorCode", "")
+
+        payment.phonepe_order_id = payload.get("orderId", "")
+
+        # callback_data is already a dict
+        payment.callback_data = callback_data
+
+        payment.save(
+            update_fields=[
+                "status",
+                "tournament",
+                "registration",
+                "meta_info",
+                "phonepe_order_id",
+                "error_code",
+                "detailed_error_code",
+                "callback_data",
+            ]
+        )
+
+        logger.info(f"Payment updated from callback: {merchant_order_id} - Status: {payment.status}")
+
+    except Payment.DoesNotExist:
+        logger.error(f"Payment not found for callback: {merchant_order_id}")
+
+
+def _handle_refund_callback(event_type, payload, callback_data):
+    """Apply a pg.refund.* webhook to the matching Refund row"""
+    merchant_refund_id = payload.get("merchantRefundId", "")
+
+    try:
+        refund = Refund.objects.get(merchant_refund_id=merchant_refund_id)
+
+        if event_type == "pg.refund.completed":
+            refund.status = "completed"
+        elif event_type == "pg.refund.failed":
+            refund.status = "failed"
+            refund.error_code = payload.get("errorCode", "")
+            refund.detailed_error_code = payload.get("detailedErrorCode", "")
+        elif event_type == "pg.refund.accepted":
+            refund.status = "accepted"
+
+        refund.phonepe_refund_id = payload.get("refundId", "")
+
+        # callback_data is already a dict
+        refund.callback_data = callback_data
+
+        refund.save(
+            update_fields=[
+                "status",
+                "error_code",
+                "detailed_error_code",
+                "phonepe_refund_id",
+                "callback_data",
+            ]
+        )
+
+        logger.info(f"Refund updated from callback: {merchant_refund_id} - Status: {refund.status}")
+
+    except Refund.DoesNotExist:
+        logger.error(f"Refund not found for callback: {merchant_refund_id}")
+
+
+# Webhook event -> handler lookup, resolved once at import instead of an
+# if/elif chain re-evaluated on every callback
+CALLBACK_HANDLERS = {
+    "checkout.order.completed": _handle_payment_callback,
+    "checkout.order.failed": _handle_payment_callback,
+    "pg.refund.completed": _handle_refund_callback,
+    "pg.refund.failed": _handle_refund_callback,
+    "pg.refund.accepted": _handle_refund_callback,
+}
+
+
 @csrf_exempt
 def phonepe_callback(request):
     """
@@ -675,8 +1057,8 @@ def phonepe_callback(request):
         logger.info(f"Callback Body: {callback_body}")
 
         # Get configured credentials
-        callback_username = config("PHONEPE_CALLBACK_USERNAME", default="")
-        callback_password = config("PHONEPE_CALLBACK_PASSWORD", default="")
+        callback_username = _CALLBACK_USERNAME
+        callback_password = _CALLBACK_PASSWORD
 
         if not callback_username or not callback_password:
             logger.warning("PhonePe callback credentials not configured")
@@ -698,341 +1080,10 @@ def phonepe_callback(request):
         logger.info(f"Payload: {json.dumps(payload, indent=2)}")
 
         # Handle different callback types
-        with transaction.atomic():
-            if event_type in ["checkout.order.completed", "checkout.order.failed"]:
-                # Payment callback
-                merchant_order_id = payload.get("merchantOrderId", "")
-                logger.info(f"Processing payment callback for order: {merchant_order_id}")
-
-                try:
-                    payment = Payment.objects.get(merchant_order_id=merchant_order_id)
-                    logger.info(f"Found payment: {payment.id}, Type: {payment.payment_type}, Status: {payment.status}")
-
-                    if event_type == "checkout.order.completed":
-                        payment.status = "completed"
-                        logger.info("Payment marked as completed")
-
-                        # Create tournament/registration from meta_info
-                        if payment.payment_type in ["tournament_plan", "scrim_plan"]:
-                            logger.info("Processing tournament/scrim creation")
-                            # Get tournament data from meta_info (stored separately, not in udf3)
-                            tournament_data = payment.meta_info.get("tournament_data", {})
-                            logger.info(f"Tournament data found: {bool(tournament_data)}")
-                            logger.info(
-                                f"Tournament data keys: {list(tournament_data.keys()) if tournament_data else 'None'}"
-                            )
-
-                            if tournament_data:
-                                host_id = tournament_data.pop("host_id", None)
-                                logger.info(f"Host ID: {host_id}")
-
-                                # Convert datetime strings back to datetime objects
-                                datetime_fields = [
-                                    "registration_start",
-                                    "registration_end",
-                                    "tournament_start",
-                                    "tournament_end",
-                                ]
-                                for field in datetime_fields:
-                                    if field in tournament_data and isinstance(tournament_data[field], str):
-                                        tournament_data[field] = datetime.fromisoformat(tournament_data[field])
-
-                                # Convert date strings
-                                if "tournament_date" in tournament_data and isinstance(
-                                    tournament_data["tournament_date"], str
-                                ):
-                                    tournament_data["tournament_date"] = datetime.fromisoformat(
-                                        tournament_data["tournament_date"]
-                                    ).date()
-
-                                # Convert time strings
-                                if "tournament_time" in tournament_data and isinstance(
-                                    tournament_data["tournament_time"], str
-                                ):
-                                    hour, minute, second = tournament_data["tournament_time"].split(":")
-                                    tournament_data["tournament_time"] = time(
-                                        int(hour), int(minute), int(float(second))
-                                    )
-
-                                # Convert numeric fields back to Decimal
-                                decimal_fields = ["entry_fee", "prize_pool", "plan_price"]
-                                for field in decimal_fields:
-                                    if field in tournament_data and not isinstance(tournament_data[field], Decimal):
-                                        tournament_data[field] = Decimal(str(tournament_data[field]))
-
-                                if host_id:
-                                    logger.info(f"Creating tournament with data: {list(tournament_data.keys())}")
-
-                                    # IDEMPOTENCY CHECK: Check if tournament already exists for this order
-                                    tournament = Tournament.objects.filter(plan_payment_id=merchant_order_id).first()
-
-                                    if not tournament:
-                                        # Remove fields that we're setting explicitly to avoid duplicates
-                                        tournament_data.pop("plan_payment_status", None)
-
-                                        host = HostProfile.objects.get(id=host_id)
-                                        tournament = Tournament.objects.create(
-                                            host=host,
-                                            plan_payment_status=True,
-                                            plan_payment_id=merchant_order_id,
-                                            **tournament_data,
-                                        )
-                                        logger.info(
-                                            f"✅ Tournament created successfully: {tournament.id} - {tournament.title}"
-                                        )
-                                    else:
-                                        logger.info(f"Tournament already exists for order: {merchant_order_id}")
-
-                                    # Link payment to tournament
-                                    payment.tournament = tournament
-
-                                    logger.info(f"Tournament linked from webhook: {tournament.id} - {tournament.title}")
-
-                                    # 📧 SEND TOURNAMENT CREATED EMAIL TO HOST
-                                    frontend_url = config(
-                                        "CORS_ALLOWED_ORIGINS", default="http://localhost:3000"
-                                    ).split(",")[0]
-                                    tournament_url = f"{frontend_url}/tournaments/{tournament.id}"
-                                    tournament_manage_url = f"{frontend_url}/host/tournaments/{tournament.id}/manage"
-                                    start_date = tournament.tournament_start.strftime("%B %d, %Y at %I:%M %p")
-                                    event_type = "Scrim" if tournament.event_mode == "SCRIM" else "Tournament"
-
-                                    send_tournament_created_email_task.delay(
-                                        host_email=host.user.email,
-                                        host_name=host.user.username,
-                                        tournament_name=tournament.title,
-                                        game_name=tournament.game_name,
-                                        start_date=start_date,
-                                        max_participants=tournament.max_participants,
-                                        plan_type=f"{tournament.plan_type} - {event_type}",
-                                        tournament_url=tournament_url,
-                                        tournament_manage_url=tournament_manage_url,
-                                    )
-
-                                    logger.info(
-                                        f"Tournament created email sent from webhook to host: {host.user.email}"
-                                    )
-
-                                    # Clear tournament_data from meta_info (no longer needed and contains Decimals)
-                                    payment.meta_info.pop("tournament_data", None)
-
-                                # Invalidate caches
-                                cache.delete("tournaments:list:all")
-                                cache.delete(f"host:dashboard:{host.id}")
-
-                        elif payment.payment_type == "entry_fee":
-                            # ===== INVITE-BASED FLOW (NEW) =====
-                            registration_id = payment.meta_info.get("udf4")
-                            if registration_id:
-                                try:
-                                    registration = TournamentRegistration.objects.get(id=int(registration_id))
-                                    if registration.temp_teammate_emails:
-                                        result = process_successful_registration(registration, merchant_order_id)
-                                        logger.info(f"✅ Invite-based registration processed from webhook: {registration.id}")
-
-                                        payment.registration = registration
-                                        cache.delete("tournaments:list:all")
-                                        cache.delete(f"host:dashboard:{registration.tournament.host.id}")
-                                except TournamentRegistration.DoesNotExist:
-                                    logger.warning(f"Registration {registration_id} not found for invite-flow (webhook)")
-                                except Exception as e:
-                                    logger.error(f"Error processing invite-based registration (webhook): {str(e)}")
-
-                            # ===== LEGACY FLOW (OLD) =====
-                            # Get registration data from meta_info (stored separately, not in udf3)
-                            # Initialize legacy variables to avoid UnboundLocalError when reg_data is empty
-                            tournament_id = None
-                            player_id = None
-                            team_id = None
-                            player_usernames = []
-                            team_name = ""
-                            save_as_team = False
-
-                            reg_data = payment.meta_info.get("registration_data", {})
-                            if reg_data:
-                                tournament_id = reg_data.pop("tournament_id", None)
-                                player_id = reg_data.pop("player_id", None)
-                                team_id = reg_data.pop("team_id", None)
-                                player_usernames = reg_data.pop("player_usernames", [])
-                                team_name = reg_data.pop("team_name", "")
-                                save_as_team = reg_data.pop("save_as_team", False)
-
-                            if tournament_id and player_id:
-                                tournament = Tournament.objects.get(id=tournament_id)
-                                player = PlayerProfile.objects.get(id=player_id)
-
-                                # Create team if needed
-                                team_instance = None
-                                if team_id:
-                                    team_instance = Team.objects.get(id=team_id)
-                                elif save_as_team:
-                                    team_instance = Team.objects.create(name=team_name, captain=player.user)
-                                    for username in player_usernames:
-                                        user_obj = User.objects.filter(username=username, user_type="player").first()
-                                        is_cap = username == player.user.username
-                                        TeamMember.objects.create(
-                                            team=team_instance, username=username, user=user_obj, is_captain=is_cap
-                                        )
-                                else:
-                                    team_instance = Team.objects.create(
-                                        name=team_name, captain=player.user, is_temporary=True
-                                    )
-
-                                # Prepare team members data
-                                team_members_data = []
-                                for username in player_usernames:
-                                    user_obj = User.objects.filter(username=username, user_type="player").first()
-                                    team_members_data.append(
-                                        {
-                                            "username": username,
-                                            "is_registered": user_obj is not None,
-                                            "player_id": user_obj.player_profile.id
-                                            if user_obj and hasattr(user_obj, "player_profile")
-                                            else None,
-                                        }
-                                    )
-
-                                # Create registration
-                                # IDEMPOTENCY CHECK: Check if registration already exists
-                                registration = TournamentRegistration.objects.filter(
-                                    payment_id=merchant_order_id
-                                ).first()
-
-                                if not registration:
-                                    registration = TournamentRegistration.objects.create(
-                                        tournament=tournament,
-                                        player=player,
-                                        team=team_instance,
-                                        team_name=team_name,
-                                        team_members=team_members_data,
-                                        payment_status=True,
-                                        payment_id=merchant_order_id,
-                                        **reg_data,
-                                    )
-
-                                    # Update participant count
-                                    tournament.current_participants += 1
-                                    tournament.save()
-                                    logger.info(f"Registration created from webhook: {registration.id}")
-                                else:
-                                    logger.info(f"Registration already exists for order: {merchant_order_id}")
-
-                                # Link payment to registration
-                                payment.registration = registration
-                                logger.info(f"Registration linked from webhook: {registration.id}")
-
-                                # 📧 SEND REGISTRATION SUCCESS EMAIL TO ALL TEAM MEMBERS
-                                frontend_url = config("CORS_ALLOWED_ORIGINS", default="http://localhost:3000").split(
-                                    ","
-                                )[0]
-                                tournament_url = f"{frontend_url}/tournaments/{tournament.id}"
-                                start_date = tournament.tournament_start.strftime("%B %d, %Y at %I:%M %p")
-
-                                # Send to captain
-                                send_tournament_registration_email_task.delay(
-                                    user_email=player.user.email,
-                                    user_name=player.user.username,
-                                    tournament_name=tournament.tournament_name,
-                                    game_name=tournament.game,
-                                    start_date=start_date,
-                                    registration_id=str(registration.id),
-                                    tournament_url=tournament_url,
-                                    team_name=team_name,
-                                )
-
-                                # Send to all team members
-                                for member_data in team_members_data:
-                                    if member_data.get("is_registered") and member_data.get("player_id"):
-                                        try:
-                                            member_player = PlayerProfile.objects.get(id=member_data["player_id"])
-                                            send_tournament_registration_email_task.delay(
-                                                user_email=member_player.user.email,
-                                                user_name=member_player.user.username,
-                                                tournament_name=tournament.tournament_name,
-                                                game_name=tournament.game,
-                                                start_date=start_date,
-                                                registration_id=str(registration.id),
-                                                tournament_url=tournament_url,
-                                                team_name=team_name,
-                                            )
-                                        except PlayerProfile.DoesNotExist:
-                                            pass
-
-                                logger.info(
-                                    f"Registration emails queued from webhook for {len(team_members_data) + 1} players"
-                                )
-
-                                # 📧 CHECK IF TOURNAMENT IS FULL - SEND SLOTS FILLED EMAIL TO HOST
-                                registration_count = TournamentRegistration.objects.filter(
-                                    tournament=tournament, status="confirmed"
-                                ).count()
-
-                                if registration_count >= tournament.max_participants:
-                                    send_registration_limit_reached_email_task.delay(
-                                        host_email=tournament.host.user.email,
-                                        host_name=tournament.host.user.username,
-                                        tournament_name=tournament.tournament_name,
-                                        total_registrations=registration_count,
-                                        max_participants=tournament.max_participants,
-                                        start_date=tournament.tournament_start.strftime("%B %d, %Y"),
-                                        tournament_manage_url=f"{frontend_url}/host/tournaments/{tournament.id}/manage",
-                                    )
-                                    logger.info(
-                                        f"Slots filled email sent from webhook to host: {tournament.host.user.email}"
-                                    )
-
-                                # Clear registration_data from meta_info (no longer needed)
-                                payment.meta_info.pop("registration_data", None)
-                                payment.save()
-
-                                # Invalidate caches
-                                cache.delete("tournaments:list:all")
-                                cache.delete(f"host:dashboard:{tournament.host.id}")
-
-                    else:  # FAILED
-                        payment.status = "failed"
-                        payment.error_code = payload.get("errorCode", "")
-                        payment.detailed_error_code = payload.get("detailedErrorCode", "")
-
-                    payment.phonepe_order_id = payload.get("orderId", "")
-
-                    # callback_data is already a dict
-                    payment.callback_data = callback_data
-
-                    payment.save()
-
-                    logger.info(f"Payment updated from callback: {merchant_order_id} - Status: {payment.status}")
-
-                except Payment.DoesNotExist:
-                    logger.error(f"Payment not found for callback: {merchant_order_id}")
-
-            elif event_type in ["pg.refund.completed", "pg.refund.failed", "pg.refund.accepted"]:
-                # Refund callback
-                merchant_refund_id = payload.get("merchantRefundId", "")
-
-                try:
-                    refund = Refund.objects.get(merchant_refund_id=merchant_refund_id)
-
-                    if event_type == "pg.refund.completed":
-                        refund.status = "completed"
-                    elif event_type == "pg.refund.failed":
-                        refund.status = "failed"
-                        refund.error_code = payload.get("errorCode", "")
-                        refund.detailed_error_code = payload.get("detailedErrorCode", "")
-                    elif event_type == "pg.refund.accepted":
-                        refund.status = "accepted"
-
-                    refund.phonepe_refund_id = payload.get("refundId", "")
-
-                    # callback_data is already a dict
-                    refund.callback_data = callback_data
-
-                    refund.save()
-
-                    logger.info(f"Refund updated from callback: {merchant_refund_id} - Status: {refund.status}")
-
-                except Refund.DoesNotExist:
-                    logger.error(f"Refund not found for callback: {merchant_refund_id}")
+        handler = CALLBACK_HANDLERS.get(event_type)
+        if handler is not None:
+            with transaction.atomic():
+                handler(event_type, payload, callback_data)
 
         logger.info("=" * 80)
         logger.info("✅ Callback processed successfully")
@@ -1,7 +1,18 @@
 """
 Celery configuration for Scrimverse
+
+Worker deployment:
+    # Default worker (prefork) for DB/CPU-bound tasks
+    celery -A scrimverse worker -Q celery
+
+    # Email worker - SES sends are pure I/O wait, so a gevent pool with high
+    # concurrency keeps hundreds of sends in flight per process at a fraction
+    # of the RAM a prefork pool of the same size would need
+    celery -A scrimverse worker -Q emails --pool=gevent --concurrency=500 --prefetch-multiplier=10 -Ofair
 """
 import os
+from datetime import timedelta
+from pathlib import Path
 
 from celery import Celery
 from celery.schedules import crontab
@@ -9,6 +20,10 @@ from celery.schedules import crontab
 # Set the default Django settings module for the 'celery' program.
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "scrimverse.settings")
 
+# The file log handlers are configured with delay=True; make sure the logs
+# directory exists before the first record is written
+(Path(__file__).resolve().parent.parent / "logs").mkdir(exist_ok=True)
+
 app = Celery("scrimverse")
 
 # Using a string here means the worker doesn't have to serialize
@@ -23,8 +38,10 @@ app.autodiscover_tasks()
 # Celery Beat schedule for periodic tasks
 app.conf.beat_schedule = {
     "update-tournament-statuses": {
+        # Safety net only - the real transitions run as ETA tasks scheduled
+        # from the Tournament post_save signal
         "task": "tournaments.tasks.update_tournament_statuses",
-        "schedule": crontab(minute="*"),  # Run every minute
+        "schedule": timedelta(minutes=15),
     },
     "cleanup-unpaid-tournaments-registrations": {
         "task": "tournaments.tasks.cleanup_unpaid_tournaments_and_registrations",
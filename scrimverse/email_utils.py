@@ -7,12 +7,17 @@ import logging
 from typing import Dict, List, Optional
 
 from django.conf import settings
-from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
-from django.utils.html import strip_tags
+
+from scrimverse.tasks import send_bulk_email_task, send_email_task
 
 logger = logging.getLogger(__name__)
 
+# Frontend URLs are frozen in settings at startup (FRONTEND_BASE_URL and
+# friends) so no per-email string construction is needed here
+_FRONTEND_URL = settings.FRONTEND_BASE_URL
+_HELP_URL = settings.HELP_URL
+_GUIDE_URL = settings.GUIDE_URL
+
 
 class EmailService:
     """Service class for sending emails"""
@@ -26,7 +31,11 @@ class EmailService:
         from_email: Optional[str] = None,
     ) -> bool:
         """
-        Send an email using a template
+        Queue an email for delivery using a template
+
+        Rendering and the SES round-trip happen in a Celery worker
+        (scrimverse.tasks.send_email_task), so callers only pay the
+        broker enqueue cost instead of blocking on SMTP I/O.
 
         Args:
             subject: Email subject
@@ -36,37 +45,64 @@ class EmailService:
             from_email: Sender email (defaults to DEFAULT_FROM_EMAIL)
 
         Returns:
-            bool: True if email sent successfully, False otherwise
+            bool: True if email queued successfully, False otherwise
         """
         try:
-            # Use default from email if not provided
-            from_email = from_email or settings.DEFAULT_FROM_EMAIL
+            send_email_task.delay(
+                subject=subject,
+                template_name=template_name,
+                context=context,
+                recipient_list=recipient_list,
+                from_email=from_email,
+            )
+
+            logger.info(f"Email queued: {subject} to {recipient_list}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to queue email: {subject} to {recipient_list}. Error: {str(e)}")
+            return False
+
+    @staticmethod
+    def send_bulk_email(
+        subject: str,
+        template_name: str,
+        shared_context: Dict,
+        per_recipient_contexts: List[Dict],
+        from_email: Optional[str] = None,
+    ) -> bool:
+        """
+        Queue one templated email for many recipients as a single batched task
 
-            # Render HTML content
-            html_content = render_to_string(f"emails/{template_name}.html", context)
+        Use this instead of calling send_email in a loop for mass sends
+        (results, promos, reminders): the worker reuses one backend connection
+        per chunk instead of paying the TCP/TLS handshake per recipient.
 
-            # Create plain text version
-            text_content = strip_tags(html_content)
+        Args:
+            subject: Email subject (same for all recipients)
+            template_name: Name of the template file (without .html)
+            shared_context: Context keys common to every recipient
+            per_recipient_contexts: List of dicts, each with an "email" key plus
+                any context keys that differ per recipient (e.g. user_name)
+            from_email: Sender email (defaults to DEFAULT_FROM_EMAIL)
 
-            # Create email message
-            email = EmailMultiAlternatives(
+        Returns:
+            bool: True if batch queued successfully, False otherwise
+        """
+        try:
+            send_bulk_email_task.delay(
                 subject=subject,
-                body=text_content,
+                template_name=template_name,
+                shared_context=shared_context,
+                per_recipient_contexts=per_recipient_contexts,
                 from_email=from_email,
-                to=recipient_list,
             )
 
-            # Attach HTML version
-            email.attach_alternative(html_content, "text/html")
-
-            # Send email
-            email.send(fail_silently=False)
-
-            logger.info(f"Email sent successfully: {subject} to {recipient_list}")
+            logger.info(f"Bulk email queued: {subject} to {len(per_recipient_contexts)} recipients")
             return True
 
         except Exception as e:
-            logger.error(f"Failed to send email: {subject} to {recipient_list}. Error: {str(e)}")
+            logger.error(f"Failed to queue bulk email: {subject}. Error: {str(e)}")
             return False
 
 
@@ -84,7 +120,7 @@ def send_welcome_email(user_email: str, user_name: str, dashboard_url: str, user
     context = {
         "user_name": user_name,
         "dashboard_url": dashboard_url,
-        "help_url": f"{settings.CORS_ALLOWED_ORIGINS[0]}/help",
+        "help_url": _HELP_URL,
         "user_type": user_type,  # Added user_type to context
     }
     if user_type == "player":
@@ -224,7 +260,7 @@ def send_host_approved_email(
         "host_name": host_name,
         "approved_at": approved_at,
         "host_dashboard_url": host_dashboard_url,
-        "guide_url": f"{settings.CORS_ALLOWED_ORIGINS[0]}/host-guide",
+        "guide_url": _GUIDE_URL,
     }
     return EmailService.send_email(
         subject=f"{user_name}, Your Scrimverse Host Account is APPROVED!",
@@ -381,8 +417,7 @@ def send_team_invite_email(
         invite_token: Unique invite token for the link
         expires_at: Human-readable expiry string
     """
-    frontend_url = settings.CORS_ALLOWED_ORIGINS[0] if settings.CORS_ALLOWED_ORIGINS else "http://localhost:3000"
-    accept_link = f"{frontend_url}/join-team/{invite_token}"
+    accept_link = f"{_FRONTEND_URL}/join-team/{invite_token}"
 
     context = {
         "invited_email": invited_email,
@@ -0,0 +1,62 @@
+"""
+Queue-based file logging for Scrimverse
+
+RotatingFileHandler writes (and rotates) under a lock on the thread that
+logged, so under concurrent WSGI workers every log line is a blocking disk
+write on the request path. setup_queue_logging() swaps each configured
+RotatingFileHandler for a QueueHandler backed by an in-memory queue and a
+background QueueListener thread that owns the file handler - requests only
+pay a queue put.
+
+Called once from wsgi.py after the application is built, i.e. after Django
+has applied the LOGGING dict from settings.
+"""
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+_listeners = []
+
+
+def setup_queue_logging():
+    """Move every RotatingFileHandler behind a QueueHandler/QueueListener pair
+
+    Each distinct file handler gets its own queue and listener so log routing
+    is unchanged - records still reach exactly the files they did before,
+    just from a background thread. Idempotent; repeat calls are no-ops.
+    """
+    if _listeners:
+        return
+
+    root = logging.getLogger()
+    all_loggers = [root] + [
+        lg for lg in logging.root.manager.loggerDict.values() if isinstance(lg, logging.Logger)
+    ]
+
+    # Loggers sharing a file handler share its queue handler
+    replacements = {}
+    for lg in all_loggers:
+        for handler in list(lg.handlers):
+            if not isinstance(handler, RotatingFileHandler):
+                continue
+            queue_handler = replacements.get(handler)
+            if queue_handler is None:
+                log_queue = queue.Queue(-1)
+                queue_handler = QueueHandler(log_queue)
+                queue_handler.setLevel(handler.level)
+                listener = QueueListener(log_queue, handler, respect_handler_level=True)
+                listener.start()
+                _listeners.append(listener)
+                replacements[handler] = queue_handler
+            lg.removeHandler(handler)
+            lg.addHandler(queue_handler)
+
+    if _listeners:
+        atexit.register(stop_queue_logging)
+
+
+def stop_queue_logging():
+    """Flush and stop the listener threads (registered via atexit)"""
+    while _listeners:
+        _listeners.pop().stop()
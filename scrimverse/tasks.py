@@ -0,0 +1,241 @@
+"""
+Project-level Celery tasks for Scrimverse
+Email delivery runs here so request threads only pay the broker enqueue cost
+"""
+import logging
+from functools import lru_cache
+from itertools import islice
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.template import TemplateDoesNotExist
+from django.template.loader import render_to_string
+from django.utils.html import strip_tags
+
+import boto3
+from botocore.config import Config as BotoConfig
+
+from scrimverse.celery import app
+
+logger = logging.getLogger(__name__)
+
+# Persistent SES client shared across the worker - reusing its HTTPS connection
+# pool avoids a TLS handshake per email (only built when USE_SES_API is on)
+_ses_client = None
+
+
+def _get_ses_client():
+    global _ses_client
+    if _ses_client is None:
+        _ses_client = boto3.client(
+            "ses",
+            region_name=settings.AWS_SES_REGION_NAME,
+            config=BotoConfig(
+                max_pool_connections=50,
+                retries={"max_attempts": 3, "mode": "adaptive"},
+            ),
+        )
+    return _ses_client
+
+
+def _deliver_via_ses(message):
+    """Send one Django email message through the pooled SES API client"""
+    _get_ses_client().send_raw_email(
+        Source=message.from_email,
+        Destinations=message.recipients(),
+        RawMessage={"Data": message.message().as_string()},
+    )
+
+# SES caps bulk destinations at 50 per API call; reuse the same limit per
+# connection batch so a single oversized blast can't monopolize the backend
+BULK_EMAIL_CHUNK_SIZE = 50
+
+
+@lru_cache(maxsize=256)
+def _render_cached(template_name, frozen_context):
+    """Render emails/<template_name>.html once per distinct context"""
+    return render_to_string(f"emails/{template_name}.html", dict(frozen_context))
+
+
+@lru_cache(maxsize=256)
+def _strip_tags_cached(html_content):
+    """Cache the plain-text version alongside the rendered HTML"""
+    return strip_tags(html_content)
+
+
+def _render_text(template_name, context, html_content):
+    """
+    Render the plain-text part of an email
+
+    Prefers a dedicated emails/<template_name>.txt template; only falls back
+    to strip_tags over the full rendered HTML when no .txt version exists.
+    """
+    try:
+        return render_to_string(f"emails/{template_name}.txt", context)
+    except TemplateDoesNotExist:
+        return strip_tags(html_content)
+
+
+def _render_email(template_name, context):
+    """
+    Return (html_content, text_content) for an email template
+
+    Promo/reminder blasts render near-identical HTML thousands of times; when
+    the context is hashable the rendered output (and its strip_tags version)
+    is memoized so repeat contexts skip the template engine entirely.
+    """
+    try:
+        frozen_context = frozenset(context.items())
+    except TypeError:
+        # Unhashable context value (list/dict) - render directly
+        html_content = render_to_string(f"emails/{template_name}.html", context)
+        return html_content, _render_text(template_name, context, html_content)
+
+    html_content = _render_cached(template_name, frozen_context)
+    try:
+        return html_content, render_to_string(f"emails/{template_name}.txt", context)
+    except TemplateDoesNotExist:
+        return html_content, _strip_tags_cached(html_content)
+
+
+def enqueue_many(task, argslist, queue="emails"):
+    """
+    Enqueue many invocations of one task over a single broker connection
+
+    A plain .delay() loop pays one Redis round-trip per task; acquiring one
+    producer from the app's pool pipelines all publishes through the same
+    socket, turning an O(n) fan-out into effectively one connection's worth
+    of writes.
+
+    Args:
+        task: The Celery task to enqueue
+        argslist: Iterable of positional-argument tuples, one per invocation
+        queue: Destination queue (defaults to the emails queue)
+    """
+    with app.producer_pool.acquire(block=True) as producer:
+        for args in argslist:
+            task.apply_async(args=args, producer=producer, queue=queue)
+
+
+@app.task(
+    bind=True,
+    name="scrimverse.tasks.send_email_task",
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    max_retries=5,
+    acks_late=True,
+    # Stay under the SES sandbox send quota (14 msg/s) and free the worker
+    # slot quickly instead of letting a stuck send hold it for the global
+    # 30-minute task limit
+    rate_limit="14/s",
+    soft_time_limit=20,
+    time_limit=30,
+)
+def send_email_task(self, subject, template_name, context, recipient_list, from_email=None):
+    """
+    Render and deliver a templated email on a worker
+
+    Args:
+        subject: Email subject
+        template_name: Name of the template file (without .html)
+        context: Context dictionary for template rendering (must be JSON-serializable)
+        recipient_list: List of recipient email addresses
+        from_email: Sender email (defaults to DEFAULT_FROM_EMAIL)
+    """
+    # Use default from email if not provided
+    from_email = from_email or settings.DEFAULT_FROM_EMAIL
+
+    # Render HTML and plain text content (memoized per distinct context)
+    html_content, text_content = _render_email(template_name, context)
+
+    # Create email message
+    email = EmailMultiAlternatives(
+        subject=subject,
+        body=text_content,
+        from_email=from_email,
+        to=recipient_list,
+    )
+
+    # Attach HTML version
+    email.attach_alternative(html_content, "text/html")
+
+    # Send email - pooled SES API in production, Django backend otherwise
+    if settings.USE_SES_API:
+        _deliver_via_ses(email)
+    else:
+        email.send(fail_silently=False)
+
+    logger.info(f"Email sent successfully: {subject} to {recipient_list}")
+    return True
+
+
+@app.task(
+    bind=True,
+    name="scrimverse.tasks.send_bulk_email_task",
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    max_retries=5,
+    acks_late=True,
+    # Bulk blasts legitimately run long, but still nowhere near the global
+    # 30-minute limit; bound them so a wedged connection can't starve workers
+    soft_time_limit=240,
+    time_limit=300,
+)
+def send_bulk_email_task(self, subject, template_name, shared_context, per_recipient_contexts, from_email=None):
+    """
+    Deliver one templated email to many recipients over shared backend connections
+
+    Instead of one connection (TCP + TLS handshake) per recipient, messages are
+    rendered per recipient but sent in chunks of BULK_EMAIL_CHUNK_SIZE through a
+    single connection via send_messages().
+
+    Args:
+        subject: Email subject (same for all recipients)
+        template_name: Name of the template file (without .html)
+        shared_context: Context keys common to every recipient
+        per_recipient_contexts: Iterable of dicts, each with an "email" key plus
+            any context keys that differ per recipient (e.g. user_name)
+        from_email: Sender email (defaults to DEFAULT_FROM_EMAIL)
+
+    Returns:
+        int: Number of emails sent
+    """
+    from_email = from_email or settings.DEFAULT_FROM_EMAIL
+
+    use_ses_api = settings.USE_SES_API
+    sent = 0
+    recipients = iter(per_recipient_contexts)
+    connection = None if use_ses_api else get_connection()
+
+    while True:
+        chunk = list(islice(recipients, BULK_EMAIL_CHUNK_SIZE))
+        if not chunk:
+            break
+
+        messages = []
+        for entry in chunk:
+            entry = dict(entry)
+            address = entry.pop("email")
+            context = {**shared_context, **entry}
+
+            html_content, text_content = _render_email(template_name, context)
+
+            message = EmailMultiAlternatives(
+                subject=subject,
+                body=text_content,
+                from_email=from_email,
+                to=[address],
+                connection=connection,
+            )
+            message.attach_alternative(html_content, "text/html")
+            messages.append(message)
+
+        if use_ses_api:
+            for message in messages:
+                _deliver_via_ses(message)
+            sent += len(messages)
+        else:
+            sent += connection.send_messages(messages) or 0
+
+    logger.info(f"Bulk email sent: {subject} to {sent} recipients")
+    return sent
@@ -3,9 +3,42 @@ WSGI config for scrimverse project.
 """
 
 import os
+from pathlib import Path
 
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "scrimverse.settings")
 
+# The file log handlers are configured with delay=True; make sure the logs
+# directory exists before the first record is written
+(Path(__file__).resolve().parent.parent / "logs").mkdir(exist_ok=True)
+
 application = get_wsgi_application()
+
+# Django has applied LOGGING by now; move file logging onto background
+# listener threads so request threads never block on disk writes
+from scrimverse.logging_setup import setup_queue_logging  # noqa: E402
+
+setup_queue_logging()
+
+
+def _warm_up():
+    """Run one synthetic request so the first real one doesn't pay setup costs
+
+    Middleware classes, authentication classes and URL patterns are dotted
+    strings resolved through import_string/the URL resolver on first use; a
+    throwaway request at startup primes those caches. A 404 is fine - the
+    resolver and middleware chain are exercised either way.
+    """
+    try:
+        from django.conf import settings
+        from django.test import Client
+
+        host = settings.ALLOWED_HOSTS[0].lstrip(".") if settings.ALLOWED_HOSTS else "localhost"
+        Client(SERVER_NAME=host).get("/api/tournaments/")
+    except Exception:
+        # Warm-up is best effort; never block startup on it
+        pass
+
+
+_warm_up()
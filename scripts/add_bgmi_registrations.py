@@ -1,63 +1,87 @@
-from accounts.models import User, PlayerProfile
-from tournaments.models import Tournament, TournamentRegistration
-
 # Add registrations to both BGMI tournaments
 TOURNAMENT_IDS = [19, 20]  # Squad and Duo
 REGISTRATIONS_PER_TOURNAMENT = 16
 
-for tid in TOURNAMENT_IDS:
-    try:
-        tournament = Tournament.objects.get(id=tid)
-    except Tournament.DoesNotExist:
-        print(f"Tournament {tid} not found. Skipping.")
-        continue
-    
-    print(f"\nAdding registrations to Tournament {tid} - {tournament.title} ({tournament.game_name})")
-    
-    # Get or create 16 player profiles
-    existing_players = list(PlayerProfile.objects.all()[:REGISTRATIONS_PER_TOURNAMENT])
-    
-    # Create missing players if needed
-    if len(existing_players) < REGISTRATIONS_PER_TOURNAMENT:
-        for i in range(len(existing_players) + 1, REGISTRATIONS_PER_TOURNAMENT + 1):
-            username = f"bgmi_t{tid}_p{i}"
-            email = f"{username}@example.com"
-            user = User.objects.create_user(
-                username=username,
-                email=email,
-                password='password',
-                user_type='player',
-                phone_number='9999999999'
+
+def main():
+    # Model imports stay inside main() so importing this module for
+    # introspection doesn't touch the Django app registry
+    from django.contrib.auth.hashers import make_password
+    from django.db import transaction
+
+    from accounts.models import User, PlayerProfile
+    from tournaments.models import Tournament, TournamentRegistration
+
+    # Hash once - the KDF dominates script CPU time, and all seed users sharing
+    # one hash is fine for test fixtures
+    pwd = make_password('password')
+
+    for tid in TOURNAMENT_IDS:
+        try:
+            tournament = Tournament.objects.get(id=tid)
+        except Tournament.DoesNotExist:
+            print(f"Tournament {tid} not found. Skipping.")
+            continue
+
+        print(f"\nAdding registrations to Tournament {tid} - {tournament.title} ({tournament.game_name})")
+
+        # One commit (and one WAL flush) per tournament instead of one per INSERT
+        with transaction.atomic():
+            # Get or create 16 player profiles (user joined in - usernames are read below)
+            existing_players = list(PlayerProfile.objects.select_related('user')[:REGISTRATIONS_PER_TOURNAMENT])
+
+            # Create missing players in bulk (3 multi-row INSERTs instead of 2 per player)
+            if len(existing_players) < REGISTRATIONS_PER_TOURNAMENT:
+                new_users = [
+                    User(
+                        username=f"bgmi_t{tid}_p{i}",
+                        email=f"bgmi_t{tid}_p{i}@example.com",
+                        password=pwd,
+                        user_type='player',
+                        phone_number='9999999999',
+                    )
+                    for i in range(len(existing_players) + 1, REGISTRATIONS_PER_TOURNAMENT + 1)
+                ]
+                User.objects.bulk_create(new_users)
+                new_profiles = PlayerProfile.objects.bulk_create([PlayerProfile(user=u) for u in new_users])
+                existing_players.extend(new_profiles)
+
+            # Create registrations in one multi-row INSERT instead of a get_or_create per row
+            already_registered = set(
+                TournamentRegistration.objects.filter(tournament=tournament).values_list('player_id', flat=True)
             )
-            pp = PlayerProfile.objects.create(user=user)
-            existing_players.append(pp)
-    
-    # Create registrations
-    created_count = 0
-    for idx, pp in enumerate(existing_players[:REGISTRATIONS_PER_TOURNAMENT], start=1):
-        tr, created_flag = TournamentRegistration.objects.get_or_create(
-            tournament=tournament,
-            player=pp,
-            defaults={
-                'team_name': f"Team_{tid}_{idx}",
-                'team_members': [pp.user.username],
-                'status': 'confirmed',
-                'payment_status': True,
-            }
-        )
-        if created_flag:
-            created_count += 1
-    
-    # Update current_participants
-    tournament.current_participants = tournament.registrations.count()
-    tournament.save(update_fields=['current_participants'])
-    
-    print(f"  Created {created_count} new registrations. Total: {tournament.current_participants}")
-    
-    # List registered teams
-    for reg in tournament.registrations.all()[:5]:
-        print(f"    - {reg.team_name} ({reg.player.user.username})")
-    if tournament.registrations.count() > 5:
-        print(f"    ... and {tournament.registrations.count() - 5} more")
-
-print("\nDone! Both BGMI tournaments now have registrations.")
+            new_regs = [
+                TournamentRegistration(
+                    tournament=tournament,
+                    player=pp,
+                    team_name=f"Team_{tid}_{idx}",
+                    team_members=[pp.user.username],
+                    status='confirmed',
+                    payment_status=True,
+                )
+                for idx, pp in enumerate(existing_players[:REGISTRATIONS_PER_TOURNAMENT], start=1)
+                if pp.id not in already_registered
+            ]
+            TournamentRegistration.objects.bulk_create(new_regs, ignore_conflicts=True)
+            created_count = len(new_regs)
+
+            # Update current_participants (count once, reuse below)
+            total = tournament.registrations.count()
+            tournament.current_participants = total
+            tournament.save(update_fields=['current_participants'])
+
+        print(f"  Created {created_count} new registrations. Total: {total}")
+
+        # List registered teams (one JOINed SELECT instead of 2 lazy loads per row)
+        for reg in tournament.registrations.select_related('player__user')[:5]:
+            print(f"    - {reg.team_name} ({reg.player.user.username})")
+        if total > 5:
+            print(f"    ... and {total - 5} more")
+
+    print("\nDone! Both BGMI tournaments now have registrations.")
+
+
+# manage.py shell -c "exec(...)" runs with the shell command's globals, so
+# accept its __name__ alongside a direct run
+if __name__ in ("__main__", "django.core.management.commands.shell"):
+    main()
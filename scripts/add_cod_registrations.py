@@ -1,47 +1,78 @@
-from tournaments.models import Tournament, TournamentRegistration
-from accounts.models import PlayerProfile, User
-
 # Number of registrations to create
 DESIRED_REGISTRATIONS = 8
 
-# Find a COD tournament
-tournament = Tournament.objects.filter(game_name__in=["COD", "Call of Duty"]).first()
-if not tournament:
-    print("No COD tournament found. Exiting.")
-else:
-    players = list(PlayerProfile.objects.all()[:DESIRED_REGISTRATIONS])
-
-    # Create missing player accounts if needed
-    next_idx = 1
-    if len(players) < DESIRED_REGISTRATIONS:
-        start = len(players) + 1
-        for i in range(start, DESIRED_REGISTRATIONS + 1):
-            username = f"autocod{i}"
-            email = f"{username}@example.com"
-            # Create user; create_user should accept extra fields on custom user model
-            user = User.objects.create_user(username=username, email=email, password="password", user_type="player", phone_number="9999999999")
-            pp = PlayerProfile.objects.create(user=user)
-            players.append(pp)
-
-    created = []
-    for idx, pp in enumerate(players, start=1):
-        tr, was_created = TournamentRegistration.objects.get_or_create(
-            tournament=tournament,
-            player=pp,
-            defaults={
-                "team_name": f"AutoTeam_COD_{idx}",
-                "team_members": [pp.user.username],
-                "status": "confirmed",
-                "payment_status": True,
-            },
+
+def main():
+    # Model imports stay inside main() so importing this module for
+    # introspection doesn't touch the Django app registry
+    from django.contrib.auth.hashers import make_password
+    from django.db import transaction
+
+    from tournaments.models import Tournament, TournamentRegistration
+    from accounts.models import PlayerProfile, User
+
+    # Hash once - the KDF dominates script CPU time, and all seed users sharing
+    # one hash is fine for test fixtures
+    pwd = make_password("password")
+
+    # Find a COD tournament
+    tournament = Tournament.objects.filter(game_name__in=["COD", "Call of Duty"]).first()
+    if not tournament:
+        print("No COD tournament found. Exiting.")
+        return
+
+    # One commit (and one WAL flush) for the whole batch instead of one per INSERT
+    with transaction.atomic():
+        # user joined in - usernames are read below
+        players = list(PlayerProfile.objects.select_related("user")[:DESIRED_REGISTRATIONS])
+
+        # Create missing player accounts in bulk if needed
+        if len(players) < DESIRED_REGISTRATIONS:
+            start = len(players) + 1
+            new_users = [
+                User(
+                    username=f"autocod{i}",
+                    email=f"autocod{i}@example.com",
+                    password=pwd,
+                    user_type="player",
+                    phone_number="9999999999",
+                )
+                for i in range(start, DESIRED_REGISTRATIONS + 1)
+            ]
+            User.objects.bulk_create(new_users)
+            players.extend(PlayerProfile.objects.bulk_create([PlayerProfile(user=u) for u in new_users]))
+
+        # One multi-row INSERT instead of a get_or_create round-trip per player;
+        # (tournament, player) is unique_together so ignore_conflicts skips dupes
+        already_registered = set(
+            TournamentRegistration.objects.filter(tournament=tournament).values_list("player_id", flat=True)
         )
-        created.append((tr, was_created))
+        new_regs = [
+            TournamentRegistration(
+                tournament=tournament,
+                player=pp,
+                team_name=f"AutoTeam_COD_{idx}",
+                team_members=[pp.user.username],
+                status="confirmed",
+                payment_status=True,
+            )
+            for idx, pp in enumerate(players, start=1)
+            if pp.id not in already_registered
+        ]
+        TournamentRegistration.objects.bulk_create(new_regs, ignore_conflicts=True)
 
-    # Update tournament participant count
-    tournament.current_participants = tournament.registrations.count()
-    tournament.save(update_fields=["current_participants"])
+        # Update tournament participant count (count once, reuse below)
+        total = tournament.registrations.count()
+        tournament.current_participants = total
+        tournament.save(update_fields=["current_participants"])
 
     print(f"Tournament ID: {tournament.id} - {tournament.title} ({tournament.game_name})")
-    print(f"Total registrations now: {tournament.current_participants}")
-    for tr, was_created in created:
-        print(f"RegID: {tr.id} | Team: {tr.team_name} | Player: {tr.player.user.username} | Created: {was_created}")
+    print(f"Total registrations now: {total}")
+    for tr in TournamentRegistration.objects.filter(tournament=tournament).select_related("player__user"):
+        print(f"RegID: {tr.id} | Team: {tr.team_name} | Player: {tr.player.user.username}")
+
+
+# manage.py shell -c "exec(...)" runs with the shell command's globals, so
+# accept its __name__ alongside a direct run
+if __name__ in ("__main__", "django.core.management.commands.shell"):
+    main()
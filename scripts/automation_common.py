@@ -0,0 +1,626 @@
+"""
+Shared helpers for the HTTP automation scripts
+
+creation_automation.py, small_tournament_automation.py,
+large_tournament_automation.py and scrim_automation.py each carried their own
+copy of the same session handling, name generators and API helpers; this
+module is the single home for them so an optimization (keep-alive session,
+banner bytes cache, fail-fast decoding, ...) lands everywhere at once.
+"""
+import json
+import random
+import string
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+BASE_URL = "http://127.0.0.1:8000/api"
+BANNER_IMAGE_PATH = "/Users/Sukruth30/Downloads/download.jpeg"
+
+# orjson encodes/decodes a few times faster than stdlib json; fall back
+# silently since it isn't a pinned dependency of this project
+try:
+    import orjson
+
+    def _dumps(data):
+        return orjson.dumps(data)
+
+    def _loads(content):
+        return orjson.loads(content)
+
+except ImportError:
+    def _dumps(data):
+        return json.dumps(data).encode()
+
+    def _loads(content):
+        return json.loads(content)
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# itertools.batched landed in 3.12; backport it so the scripts chunk players
+# into teams in one O(n) pass instead of re-slicing the list per team
+try:
+    from itertools import batched
+except ImportError:
+    from itertools import islice
+
+    def batched(iterable, n):
+        """Yield successive lists of up to n items from iterable"""
+        it = iter(iterable)
+        while batch := list(islice(it, n)):
+            yield batch
+
+# One Session for the whole run - keep-alive reuses the TCP connection to the
+# dev server instead of paying a handshake per request. A bounded retry with
+# backoff rides on it so one transient 502 mid-run doesn't abort the script
+# and force a full re-run; pool_maxsize matches the thread pools so concurrent
+# workers each get a pooled connection. HTTP/1.1 keep-alive is the ceiling
+# here: the Django dev server these scripts target speaks no HTTP/2, so
+# multiplexing all workers over one connection isn't an option.
+session = requests.Session()
+_retry = Retry(total=5, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504], allowed_methods=["POST"])
+session.mount("http://", HTTPAdapter(max_retries=_retry, pool_maxsize=32))
+
+# (connect, read) timeout for every call so a stuck server can't hang a
+# worker thread indefinitely
+TIMEOUT = (3.0, 15.0)
+
+# Read the banner once; every event creation reuses the same bytes instead of
+# re-opening the file per request
+try:
+    with open(BANNER_IMAGE_PATH, "rb") as img:
+        BANNER_BYTES = img.read()
+except FileNotFoundError:
+    BANNER_BYTES = None
+    print(f"Warning: Banner image not found at {BANNER_IMAGE_PATH}, creating events without banner")
+
+# Meaningful team name components
+TEAM_PREFIXES = [
+    "Alpha",
+    "Beta",
+    "Gamma",
+    "Delta",
+    "Omega",
+    "Sigma",
+    "Phoenix",
+    "Dragon",
+    "Tiger",
+    "Wolf",
+    "Eagle",
+    "Falcon",
+    "Hawk",
+    "Raven",
+    "Viper",
+    "Cobra",
+    "Panther",
+    "Lion",
+    "Bear",
+    "Shark",
+    "Thunder",
+    "Lightning",
+    "Storm",
+    "Blaze",
+    "Inferno",
+    "Frost",
+    "Ice",
+    "Shadow",
+    "Ghost",
+    "Phantom",
+    "Titan",
+    "Warrior",
+    "Knight",
+    "Samurai",
+    "Ninja",
+    "Spartan",
+    "Viking",
+    "Gladiator",
+    "Crusader",
+    "Sentinel",
+    "Nova",
+    "Nebula",
+    "Comet",
+    "Meteor",
+    "Stellar",
+    "Cosmic",
+    "Quantum",
+    "Atomic",
+    "Nuclear",
+    "Plasma",
+    "Apex",
+    "Elite",
+    "Prime",
+    "Supreme",
+    "Ultimate",
+    "Legendary",
+    "Mythic",
+    "Epic",
+    "Heroic",
+    "Immortal",
+    "Venom",
+    "Toxin",
+    "Poison",
+    "Fury",
+    "Rage",
+    "Wrath",
+    "Chaos",
+    "Havoc",
+    "Mayhem",
+    "Carnage",
+    "Steel",
+    "Iron",
+    "Titanium",
+    "Chrome",
+    "Silver",
+    "Gold",
+    "Platinum",
+    "Diamond",
+    "Crystal",
+    "Obsidian",
+    "Cyber",
+    "Digital",
+    "Neon",
+    "Pulse",
+    "Volt",
+    "Surge",
+    "Shock",
+    "Blitz",
+    "Rush",
+    "Dash",
+    "Royal",
+    "Imperial",
+    "Regal",
+    "Noble",
+    "Majestic",
+    "Divine",
+    "Sacred",
+    "Holy",
+    "Blessed",
+    "Chosen",
+]
+
+TEAM_SUFFIXES = [
+    "Squad",
+    "Force",
+    "Legion",
+    "Battalion",
+    "Regiment",
+    "Division",
+    "Brigade",
+    "Unit",
+    "Crew",
+    "Gang",
+    "Clan",
+    "Guild",
+    "Alliance",
+    "Coalition",
+    "Syndicate",
+    "Cartel",
+    "Empire",
+    "Kingdom",
+    "Dynasty",
+    "Order",
+    "Warriors",
+    "Fighters",
+    "Soldiers",
+    "Hunters",
+    "Slayers",
+    "Killers",
+    "Assassins",
+    "Reapers",
+    "Destroyers",
+    "Annihilators",
+    "Guardians",
+    "Protectors",
+    "Defenders",
+    "Sentinels",
+    "Watchers",
+    "Keepers",
+    "Champions",
+    "Heroes",
+    "Legends",
+    "Titans",
+    "Wolves",
+    "Lions",
+    "Tigers",
+    "Bears",
+    "Eagles",
+    "Hawks",
+    "Falcons",
+    "Ravens",
+    "Vipers",
+    "Cobras",
+    "Strikers",
+    "Raiders",
+    "Invaders",
+    "Conquerors",
+    "Dominators",
+    "Rulers",
+    "Masters",
+    "Lords",
+    "Kings",
+    "Emperors",
+    "Phantoms",
+    "Ghosts",
+    "Shadows",
+    "Specters",
+    "Wraiths",
+    "Spirits",
+    "Demons",
+    "Devils",
+    "Fiends",
+    "Monsters",
+    "Blazers",
+    "Burners",
+    "Scorchers",
+    "Infernos",
+    "Flames",
+    "Pyros",
+    "Igniters",
+    "Torches",
+    "Embers",
+    "Ashes",
+    "Storms",
+    "Tempests",
+    "Hurricanes",
+    "Cyclones",
+    "Tornadoes",
+    "Whirlwinds",
+    "Gales",
+    "Blizzards",
+    "Avalanches",
+    "Tsunamis",
+    "Elites",
+    "Pros",
+    "Aces",
+    "Stars",
+    "Legends",
+    "Icons",
+    "Idols",
+    "Myths",
+    "Fables",
+    "Tales",
+]
+
+PLAYER_FIRST_NAMES = [
+    "Shadow",
+    "Blaze",
+    "Storm",
+    "Frost",
+    "Venom",
+    "Titan",
+    "Phoenix",
+    "Dragon",
+    "Wolf",
+    "Eagle",
+    "Ghost",
+    "Phantom",
+    "Viper",
+    "Cobra",
+    "Thunder",
+    "Lightning",
+    "Nova",
+    "Nebula",
+    "Cosmic",
+    "Quantum",
+    "Steel",
+    "Iron",
+    "Chrome",
+    "Silver",
+    "Gold",
+    "Cyber",
+    "Neon",
+    "Pulse",
+    "Volt",
+    "Surge",
+    "Apex",
+    "Elite",
+    "Prime",
+    "Supreme",
+    "Legendary",
+    "Mythic",
+    "Epic",
+    "Heroic",
+    "Divine",
+    "Sacred",
+    "Fury",
+    "Rage",
+    "Wrath",
+    "Chaos",
+    "Havoc",
+    "Royal",
+    "Imperial",
+    "Regal",
+    "Noble",
+    "Majestic",
+    "Alpha",
+    "Beta",
+    "Gamma",
+    "Delta",
+    "Omega",
+    "Sigma",
+    "Zeta",
+    "Kappa",
+    "Lambda",
+    "Theta",
+    "Ace",
+    "King",
+    "Queen",
+    "Knight",
+    "Rook",
+    "Bishop",
+    "Pawn",
+    "Duke",
+    "Baron",
+    "Count",
+    "Ninja",
+    "Samurai",
+    "Ronin",
+    "Shogun",
+    "Daimyo",
+    "Sensei",
+    "Master",
+    "Guru",
+    "Sage",
+    "Oracle",
+    "Reaper",
+    "Slayer",
+    "Hunter",
+    "Stalker",
+    "Tracker",
+    "Scout",
+    "Ranger",
+    "Sniper",
+    "Marksman",
+    "Gunner",
+    "Warrior",
+    "Fighter",
+    "Soldier",
+    "Trooper",
+    "Marine",
+    "Commando",
+    "Raider",
+    "Striker",
+    "Assault",
+    "Vanguard",
+]
+
+PLAYER_LAST_NAMES = [
+    "Killer",
+    "Slayer",
+    "Hunter",
+    "Reaper",
+    "Destroyer",
+    "Annihilator",
+    "Terminator",
+    "Eliminator",
+    "Executioner",
+    "Punisher",
+    "Master",
+    "Lord",
+    "King",
+    "Emperor",
+    "Ruler",
+    "Champion",
+    "Legend",
+    "Hero",
+    "Titan",
+    "God",
+    "Warrior",
+    "Fighter",
+    "Soldier",
+    "Trooper",
+    "Marine",
+    "Commando",
+    "Ranger",
+    "Scout",
+    "Sniper",
+    "Gunner",
+    "Shadow",
+    "Ghost",
+    "Phantom",
+    "Specter",
+    "Wraith",
+    "Spirit",
+    "Demon",
+    "Devil",
+    "Fiend",
+    "Monster",
+    "Storm",
+    "Thunder",
+    "Lightning",
+    "Blaze",
+    "Inferno",
+    "Frost",
+    "Ice",
+    "Venom",
+    "Toxin",
+    "Poison",
+    "Steel",
+    "Iron",
+    "Titanium",
+    "Chrome",
+    "Silver",
+    "Gold",
+    "Platinum",
+    "Diamond",
+    "Crystal",
+    "Obsidian",
+    "Wolf",
+    "Lion",
+    "Tiger",
+    "Bear",
+    "Eagle",
+    "Hawk",
+    "Falcon",
+    "Raven",
+    "Viper",
+    "Cobra",
+    "Striker",
+    "Raider",
+    "Invader",
+    "Conqueror",
+    "Dominator",
+    "Crusher",
+    "Breaker",
+    "Smasher",
+    "Basher",
+    "Thrasher",
+    "Ace",
+    "Pro",
+    "Star",
+    "Icon",
+    "Idol",
+    "Myth",
+    "Fable",
+    "Tale",
+    "Saga",
+    "Epic",
+    "Blade",
+    "Sword",
+    "Axe",
+    "Hammer",
+    "Spear",
+    "Lance",
+    "Arrow",
+    "Bolt",
+    "Bullet",
+    "Missile",
+]
+
+# One Random instance per worker thread - concurrent workers would otherwise
+# serialize on the global RNG's lock
+_local = threading.local()
+
+
+def _rng():
+    rng = getattr(_local, "rng", None)
+    if rng is None:
+        rng = _local.rng = random.Random()
+    return rng
+
+
+def random_email(prefix):
+    return f"{prefix}_{''.join(_rng().choices(string.ascii_lowercase, k=5))}@test.com"
+
+
+def generate_team_name():
+    """Generate a meaningful team name"""
+    rng = _rng()
+    return f"{rng.choice(TEAM_PREFIXES)} {rng.choice(TEAM_SUFFIXES)}"
+
+
+def generate_player_name():
+    """Generate a meaningful player username"""
+    rng = _rng()
+    return f"{rng.choice(PLAYER_FIRST_NAMES)}{rng.choice(PLAYER_LAST_NAMES)}{rng.randint(1, 999)}"
+
+
+def register_host(email_prefix="host", username_prefix="TestHost"):
+    url = f"{BASE_URL}/accounts/host/register/"
+    random_suffix = "".join(_rng().choices(string.ascii_lowercase, k=5))
+    data = {
+        "email": random_email(email_prefix),
+        "username": f"{username_prefix}_{random_suffix}",
+        "password": "TestPass123!",
+        "password2": "TestPass123!",
+        "phone_number": "9999999999",
+    }
+    res = session.post(url, data=_dumps(data), headers=JSON_HEADERS, timeout=TIMEOUT)
+    # Fail fast on an error status instead of KeyError-ing on the error body -
+    # every later request depends on this token
+    if not res.ok:
+        raise RuntimeError(f"{url} -> {res.status_code}: {res.text[:500]}")
+    body = _loads(res.content)
+    print("Host Registered:", body["user"]["email"])
+    return body["tokens"]["access"], body["user"]
+
+
+def create_event(token, data, rounds_json=None):
+    """POST /tournaments/create/ with the shared banner handling
+
+    `data` carries the event payload with "rounds" as a list; the multipart
+    branch needs it as a JSON string, which callers with a constant rounds
+    structure can pre-serialize and pass as `rounds_json`. Returns the decoded
+    response body.
+    """
+    url = f"{BASE_URL}/tournaments/create/"
+    headers = {"Authorization": f"Bearer {token}"}
+
+    if BANNER_BYTES is not None:
+        files = {"banner_image": ("download.jpeg", BANNER_BYTES, "image/jpeg")}
+        form_data = {**data, "rounds": rounds_json or json.dumps(data["rounds"])}
+        res = session.post(url, data=form_data, files=files, headers=headers, timeout=TIMEOUT)
+    else:
+        res = session.post(url, data=_dumps(data), headers={**headers, **JSON_HEADERS}, timeout=TIMEOUT)
+
+    if not res.ok:
+        raise RuntimeError(f"{url} -> {res.status_code}: {res.text[:500]}")
+    return _loads(res.content)
+
+
+def create_player(username, email_prefix="player"):
+    """Register a single player and return their credentials (None on failure)"""
+    player_email = random_email(email_prefix)
+    url = f"{BASE_URL}/accounts/player/register/"
+
+    data = {
+        "email": player_email,
+        "username": username,
+        "password": "TestPass123!",
+        "password2": "TestPass123!",
+        "phone_number": "8888888888",
+    }
+    res = session.post(url, data=_dumps(data), headers=JSON_HEADERS, timeout=TIMEOUT)
+
+    if res.status_code != 201:
+        print(f"ERROR: Failed to register player. Response: {res.text}")
+        return None
+
+    res_data = _loads(res.content)
+    return {
+        "email": player_email,
+        "username": res_data["user"]["username"],
+        "token": res_data["tokens"]["access"],
+        "id": res_data["user"]["id"],
+    }
+
+
+def create_team(captain_player, team_name, member_usernames):
+    """Create a team with the captain and members"""
+    url = f"{BASE_URL}/accounts/teams/"
+    headers = {"Authorization": f"Bearer {captain_player['token']}"}
+
+    data = {
+        "name": team_name,
+        "player_usernames": member_usernames,  # Includes captain and other members
+    }
+
+    res = session.post(url, data=_dumps(data), headers={**headers, **JSON_HEADERS}, timeout=TIMEOUT)
+
+    if res.status_code == 201:
+        team_data = _loads(res.content)
+        return team_data["id"]
+    else:
+        print(f"  ❌ Failed to create team {team_name}: {res.text}")
+        return None
+
+
+def register_team_to_tournament(tournament_id, captain_player, team_id, save_as_team=True):
+    """Register an existing team to a tournament (or scrim)"""
+    register_url = f"{BASE_URL}/tournaments/{tournament_id}/register/"
+    headers = {"Authorization": f"Bearer {captain_player['token']}"}
+
+    reg_data = {
+        "team_id": team_id,
+        "save_as_team": save_as_team,  # Whether to save as permanent team
+    }
+
+    reg_response = session.post(register_url, data=_dumps(reg_data), headers={**headers, **JSON_HEADERS}, timeout=TIMEOUT)
+    if reg_response.status_code == 201:
+        return True
+    else:
+        print(f"  ❌ Failed to register team: {reg_response.text}")
+        return False
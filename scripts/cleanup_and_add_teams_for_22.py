@@ -1,93 +1,112 @@
-from django.db import transaction
-from accounts.models import User, PlayerProfile
-from tournaments.models import Tournament, TournamentRegistration, Group, Match, MatchScore
-
 # Cleanup any auto-created COD registrations and lobby data
 AUTO_PREFIX = "AutoTeam_COD_"
+TARGET_TID = 22
+DESIRED = 8
 
-# Find tournaments that have AUTO_PREFIX registrations
-auto_regs = TournamentRegistration.objects.filter(team_name__startswith=AUTO_PREFIX)
-affected_tournament_ids = set(reg.tournament.id for reg in auto_regs)
 
-print(f"Found auto registrations for tournaments: {affected_tournament_ids}")
+def main():
+    # Model imports stay inside main() so importing this module for
+    # introspection doesn't touch the Django app registry
+    from django.contrib.auth.hashers import make_password
+    from django.db import transaction
 
-for tid in affected_tournament_ids:
-    try:
-        t = Tournament.objects.get(id=tid)
-    except Tournament.DoesNotExist:
-        continue
-    print(f"Cleaning tournament {t.id} - {t.title}")
-
-    # Delete groups named as Lobbies for this tournament
-    lobbies = Group.objects.filter(tournament=t, group_name__istartswith='Lobby')
-    lobby_ids = [g.id for g in lobbies]
-    print(f"  Deleting {len(lobbies)} lobby groups")
-
-    # Delete matches and match scores for these lobbies
-    matches = Match.objects.filter(group__in=lobbies)
-    ms_count = MatchScore.objects.filter(match__in=matches).count()
-    print(f"  Deleting {ms_count} match scores and {matches.count()} matches")
-    MatchScore.objects.filter(match__in=matches).delete()
-    matches.delete()
-
-    # Delete the lobby groups
-    lobbies.delete()
-
-    # Remove auto registrations for this tournament
-    regs = TournamentRegistration.objects.filter(tournament=t, team_name__startswith=AUTO_PREFIX)
-    print(f"  Deleting {regs.count()} auto registrations")
-    regs.delete()
-
-    # Reset tournament fields that were modified by the simulation
-    t.selected_teams = {}
-    t.round_status = {}
-    t.winners = {}
-    t.current_round = 0
-    # Recalculate current_participants (after deletion)
-    t.current_participants = t.registrations.count()
-    t.save(update_fields=['selected_teams','round_status','winners','current_round','current_participants'])
-    print(f"  Tournament {t.id} cleaned. current_participants={t.current_participants}")
-
-# Now add registrations to tournament 22 only
-TARGET_TID = 22
-try:
-    target = Tournament.objects.get(id=TARGET_TID)
-except Tournament.DoesNotExist:
-    print(f"Tournament {TARGET_TID} not found. Exiting.")
-    raise SystemExit(1)
+    from accounts.models import User, PlayerProfile
+    from tournaments.models import Tournament, TournamentRegistration, Group
 
-DESIRED = 8
-created = []
-
-# Create or reuse player profiles
-existing_players = list(PlayerProfile.objects.all())[:DESIRED]
-
-# create users if needed
-if len(existing_players) < DESIRED:
-    for i in range(len(existing_players)+1, DESIRED+1):
-        username = f"cod22_p{i}"
-        email = f"{username}@example.com"
-        user = User.objects.create_user(username=username, email=email, password='password', user_type='player', phone_number='9999999999')
-        pp = PlayerProfile.objects.create(user=user)
-        existing_players.append(pp)
-
-for idx, pp in enumerate(existing_players, start=1):
-    tr, created_flag = TournamentRegistration.objects.get_or_create(
-        tournament=target,
-        player=pp,
-        defaults={
-            'team_name': f"AutoTeam_COD_{idx}",
-            'team_members': [pp.user.username],
-            'status': 'confirmed',
-            'payment_status': True,
-        }
-    )
-    created.append((tr, created_flag))
+    # Hash once - the KDF dominates script CPU time, and all seed users sharing
+    # one hash is fine for test fixtures
+    pwd = make_password('password')
 
-# Update tournament current_participants
-target.current_participants = target.registrations.count()
-target.save(update_fields=['current_participants'])
+    # Find tournaments that have AUTO_PREFIX registrations
+    affected_tournament_ids = set(
+        TournamentRegistration.objects.filter(team_name__startswith=AUTO_PREFIX).values_list('tournament_id', flat=True)
+    )
 
-print(f"Added/ensured {len(created)} registrations for tournament {target.id}. current_participants={target.current_participants}")
-for tr, flag in created:
-    print(f" RegID: {tr.id} | Team: {tr.team_name} | Player: {tr.player.user.username} | New: {flag}")
+    print(f"Found auto registrations for tournaments: {affected_tournament_ids}")
+
+    with transaction.atomic():
+        for tid in affected_tournament_ids:
+            try:
+                t = Tournament.objects.get(id=tid)
+            except Tournament.DoesNotExist:
+                continue
+            print(f"Cleaning tournament {t.id} - {t.title}")
+
+            # Delete lobby groups for this tournament - Match.group and
+            # MatchScore.match are on_delete=CASCADE, so one delete takes the
+            # matches and scores with it
+            lobbies = Group.objects.filter(tournament=t, group_name__istartswith='Lobby')
+            lobby_ids = list(lobbies.values_list('id', flat=True))
+            print(f"  Deleting {len(lobby_ids)} lobby groups (cascades to matches and scores)")
+            lobbies.delete()
+
+            # Remove auto registrations for this tournament
+            regs = TournamentRegistration.objects.filter(tournament=t, team_name__startswith=AUTO_PREFIX)
+            deleted_regs, _ = regs.delete()
+            print(f"  Deleted {deleted_regs} auto registration rows")
+
+            # Reset tournament fields that were modified by the simulation
+            t.selected_teams = {}
+            t.round_status = {}
+            t.winners = {}
+            t.current_round = 0
+            # Recalculate current_participants (after deletion; count once, reuse below)
+            remaining = t.registrations.count()
+            t.current_participants = remaining
+            t.save(update_fields=['selected_teams','round_status','winners','current_round','current_participants'])
+            print(f"  Tournament {t.id} cleaned. current_participants={remaining}")
+
+    # Now add registrations to tournament 22 only
+    try:
+        target = Tournament.objects.get(id=TARGET_TID)
+    except Tournament.DoesNotExist:
+        print(f"Tournament {TARGET_TID} not found. Exiting.")
+        raise SystemExit(1)
+
+    created = []
+
+    # Create or reuse player profiles (user joined in - usernames are read below)
+    existing_players = list(PlayerProfile.objects.select_related('user')[:DESIRED])
+
+    # create users if needed (pre-hashed password, so no per-user KDF run)
+    if len(existing_players) < DESIRED:
+        new_users = [
+            User(
+                username=f"cod22_p{i}",
+                email=f"cod22_p{i}@example.com",
+                password=pwd,
+                user_type='player',
+                phone_number='9999999999',
+            )
+            for i in range(len(existing_players)+1, DESIRED+1)
+        ]
+        User.objects.bulk_create(new_users)
+        existing_players.extend(PlayerProfile.objects.bulk_create([PlayerProfile(user=u) for u in new_users]))
+
+    for idx, pp in enumerate(existing_players, start=1):
+        tr, created_flag = TournamentRegistration.objects.get_or_create(
+            tournament=target,
+            player=pp,
+            defaults={
+                'team_name': f"AutoTeam_COD_{idx}",
+                'team_members': [pp.user.username],
+                'status': 'confirmed',
+                'payment_status': True,
+            }
+        )
+        created.append((tr, created_flag))
+
+    # Update tournament current_participants (count once, reuse below)
+    total = target.registrations.count()
+    target.current_participants = total
+    target.save(update_fields=['current_participants'])
+
+    print(f"Added/ensured {len(created)} registrations for tournament {target.id}. current_participants={total}")
+    for tr, flag in created:
+        print(f" RegID: {tr.id} | Team: {tr.team_name} | Player: {tr.player.user.username} | New: {flag}")
+
+
+# manage.py shell -c "exec(...)" runs with the shell command's globals, so
+# accept its __name__ alongside a direct run
+if __name__ in ("__main__", "django.core.management.commands.shell"):
+    main()
@@ -9,14 +9,21 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "scrimverse.settings")
 django.setup()
 
+from django.db import transaction  # noqa
+from django.db.models import Count  # noqa
+
 from accounts.models import User  # noqa
-from tournaments.models import Scrim, ScrimRegistration, Tournament, TournamentRegistration  # noqa
+from tournaments.models import Tournament, TournamentRegistration  # noqa
 
 
 def cleanup_test_accounts():
     """
     Deletes all test host and player accounts and related data
     (accounts created by automation with emails containing '@test.com').
+
+    Everything happens as queryset-level bulk deletes - a handful of
+    DELETE ... WHERE statements instead of one round-trip per entity -
+    with FK cascades taking care of the dependent rows.
     """
     test_users = User.objects.filter(email__icontains="@test.com")
     total = test_users.count()
@@ -27,46 +34,37 @@ def cleanup_test_accounts():
 
     print(f"🧹 Found {total} test accounts to delete...\n")
 
-    for user in test_users:
-        user_type = user.user_type
-        email = user.email
-
-        if user_type == "host":
-            if hasattr(user, "host_profile"):
-                host_profile = user.host_profile
-                # Delete tournaments hosted by this host
-                tournaments = Tournament.objects.filter(host=host_profile)
-                for t in tournaments:
-                    # Delete related tournament registrations
-                    TournamentRegistration.objects.filter(tournament=t).delete()
-                    print(f"   🗑️ Deleted registrations for Tournament: {t.title}")
-                    t.delete()
-                    print(f"   🏁 Deleted Tournament: {t.title}")
-
-                # Delete scrims hosted by this host
-                scrims = Scrim.objects.filter(host=host_profile)
-                for s in scrims:
-                    ScrimRegistration.objects.filter(scrim=s).delete()
-                    print(f"   🗑️ Deleted registrations for Scrim: {s.title}")
-                    s.delete()
-                    print(f"   🏁 Deleted Scrim: {s.title}")
-
-                host_profile.delete()
-                print(f"✅ Deleted host profile: {email}")
-
-        elif user_type == "player":
-            if hasattr(user, "player_profile"):
-                player_profile = user.player_profile
-                # Delete all tournament registrations by player
-                TournamentRegistration.objects.filter(player=player_profile).delete()
-                # Delete all scrim registrations by player
-                ScrimRegistration.objects.filter(player=player_profile).delete()
-                player_profile.delete()
-                print(f"✅ Deleted player profile and registrations: {email}")
-
-        # Finally delete the user
-        user.delete()
-        print(f"🧨 Deleted {user_type} account: {email}\n")
+    # Per-user summary in one annotated query (JOIN + GROUP BY) instead of
+    # separate tournament/registration lookups per user; values_list +
+    # iterator() streams the four columns rather than materializing full
+    # User instances
+    summary = test_users.annotate(
+        hosted_events=Count("host_profile__tournaments", distinct=True),
+        registrations=Count("player_profile__tournament_registrations", distinct=True),
+    ).values_list("email", "user_type", "hosted_events", "registrations")
+    for email, user_type, hosted_events, registrations in summary.iterator(chunk_size=500):
+        print(f"   {user_type}: {email} (hosted events: {hosted_events}, registrations: {registrations})")
+    print()
+
+    # One transaction around all three deletes - a single BEGIN/COMMIT (and
+    # one fsync on Postgres) instead of an autocommit per statement, and the
+    # cleanup is all-or-nothing if a later delete fails
+    with transaction.atomic():
+        # Hosted events first (scrims are Tournament rows with event_mode="SCRIM");
+        # deleting a Tournament cascades to its registrations, so this is one bulk
+        # delete. The filters join through to the email condition at the SQL level
+        # rather than materializing the user ids in Python first, and no
+        # Tournament columns are ever fetched - the delete works purely on ids.
+        deleted, _ = Tournament.objects.filter(host__user__in=test_users).delete()
+        print(f"🏁 Deleted {deleted} tournament/scrim rows (registrations cascade included)")
+
+        # Registrations the test players made in *other* hosts' events
+        deleted, _ = TournamentRegistration.objects.filter(player__user__in=test_users).delete()
+        print(f"🗑️ Deleted {deleted} registration rows by test players")
+
+        # Users last - host/player profiles cascade with them
+        deleted, _ = test_users.delete()
+        print(f"🧨 Deleted {deleted} user/profile rows")
 
     print("\n✨ Cleanup complete! All test accounts and their related data removed successfully.")
 
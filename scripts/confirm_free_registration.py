@@ -16,7 +16,10 @@ django.setup()
 from tournaments.models import TournamentRegistration
 from tournaments.tasks import send_tournament_registration_email_task, update_host_dashboard_stats
 from accounts.models import User
+from celery import group
 from django.conf import settings
+from django.db.models.functions import Lower
+from scrimverse.celery import app
 
 
 def confirm_registration(reg_id):
@@ -28,19 +31,27 @@ def confirm_registration(reg_id):
     reg.payment_status = True
     reg.status = 'confirmed'
 
-    # Populate team_members from temp_teammate_emails if empty
+    # Populate team_members from temp_teammate_emails if empty - one IN query
+    # (case-normalized to keep the old iexact semantics) instead of a
+    # User.objects.get per email
     if (not reg.team_members) and reg.temp_teammate_emails:
+        by_email = {
+            u.email_l: u
+            for u in User.objects.annotate(email_l=Lower('email'))
+            .filter(email_l__in=[e.lower() for e in reg.temp_teammate_emails], user_type='player')
+            .select_related('player_profile')
+        }
         team_members = []
         for email in reg.temp_teammate_emails:
-            try:
-                u = User.objects.get(email__iexact=email, user_type='player')
+            u = by_email.get(email.lower())
+            if u is not None:
                 team_members.append({
                     'email': email,
                     'username': u.username,
                     'player_id': getattr(u.player_profile, 'id', None),
                     'is_registered': True,
                 })
-            except Exception:
+            else:
                 team_members.append({
                     'email': email,
                     'username': None,
@@ -56,39 +67,54 @@ def confirm_registration(reg_id):
     t.current_participants = (t.current_participants or 0) + 1
     t.save()
 
-    # Trigger host dashboard update and send emails
-    update_host_dashboard_stats.delay(t.host.id)
-
-    send_tournament_registration_email_task.delay(
-        user_email=reg.player.user.email,
-        user_name=reg.player.user.username,
-        tournament_name=t.title,
-        game_name=t.game_name,
-        start_date=t.tournament_start.strftime('%B %d, %Y at %I:%M %p'),
-        registration_id=str(reg.id),
-        tournament_url=f"{settings.FRONTEND_URL}/tournaments/{t.id}",
-        team_name=reg.team_name,
-    )
-
-    # Send to registered teammates
+    # Loop-invariant email fields, formatted once for captain and teammates
+    start_date_str = t.tournament_start.strftime('%B %d, %Y at %I:%M %p')
+    tournament_url = f"{settings.FRONTEND_URL}/tournaments/{t.id}"
+
+    # Dashboard update plus captain email, published together with the
+    # teammate emails below as one Celery group over a single pooled
+    # producer - one broker submission instead of one .delay() round-trip
+    # per task
+    signatures = [
+        update_host_dashboard_stats.s(t.host.id),
+        send_tournament_registration_email_task.s(
+            user_email=reg.player.user.email,
+            user_name=reg.player.user.username,
+            tournament_name=t.title,
+            game_name=t.game_name,
+            start_date=start_date_str,
+            registration_id=str(reg.id),
+            tournament_url=tournament_url,
+            team_name=reg.team_name,
+        ),
+    ]
+
+    # Registered teammates
     if reg.team_members:
         captain_name = reg.player.user.username
-        for member in reg.team_members:
-            if member.get('is_registered') and member.get('username') and member.get('username') != captain_name:
-                try:
-                    mu = User.objects.get(username=member.get('username'), user_type='player')
-                    send_tournament_registration_email_task.delay(
-                        user_email=mu.email,
-                        user_name=mu.username,
-                        tournament_name=t.title,
-                        game_name=t.game_name,
-                        start_date=t.tournament_start.strftime('%B %d, %Y at %I:%M %p'),
-                        registration_id=str(reg.id),
-                        tournament_url=f"{settings.FRONTEND_URL}/tournaments/{t.id}",
-                        team_name=reg.team_name,
-                    )
-                except Exception:
-                    continue
+        usernames = [
+            m['username']
+            for m in reg.team_members
+            if m.get('is_registered') and m.get('username') and m['username'] != captain_name
+        ]
+        # One IN query for all teammates instead of a get() per member
+        users = User.objects.filter(username__in=usernames, user_type='player').in_bulk(field_name='username')
+        signatures.extend(
+            send_tournament_registration_email_task.s(
+                mu.email,
+                mu.username,
+                t.title,
+                t.game_name,
+                start_date_str,
+                str(reg.id),
+                tournament_url,
+                reg.team_name,
+            )
+            for mu in users.values()
+        )
+
+    with app.producer_pool.acquire(block=True) as producer:
+        group(signatures).apply_async(producer=producer)
 
     print(f"Confirmed registration {reg.id} and queued emails")
 
@@ -1,4 +1,6 @@
 import random
+from django.db import transaction
+from django.db.models import Prefetch
 from tournaments.services import TournamentGroupService
 from tournaments.models import Tournament, Group, Match, MatchScore
 
@@ -18,48 +20,76 @@ if res.get('error'):
     print('Error creating groups:', res['error'])
     raise SystemExit(1)
 
-groups = res['groups']
+# Re-fetch the groups with their teams and ordered matches prefetched -
+# two queries total instead of one teams + one matches query per group
+groups = list(
+    Group.objects.filter(id__in=[g.id for g in res['groups']]).prefetch_related(
+        'teams',
+        Prefetch('matches', queryset=Match.objects.order_by('match_number')),
+    )
+)
 print(f"Created {len(groups)} lobbies. Bye team: {res.get('bye_team')}")
 
-# Simulate matches: give team A wins in most matches to deterministically produce winners
-for group in groups:
-    print(f"Simulating group: {group.group_name} | Teams: {[t.team_name for t in group.teams.all()]}")
-    matches = list(group.matches.order_by('match_number'))
-    teams = list(group.teams.all())
-    if len(teams) != 2:
-        print('Skipping non-2-team group')
-        continue
-    team_a = teams[0]
-    team_b = teams[1]
-
-    for match in matches:
-        # Randomized but biased to team_a to ensure a winner
-        a_pos = random.randint(10, 25)
-        b_pos = random.randint(5, 20)
-        a_kills = random.randint(5, 15)
-        b_kills = random.randint(0, 10)
-
-        if b_pos + b_kills > a_pos + a_kills:
-            # swap to keep team_a winning mostly
-            a_pos, b_pos = b_pos, a_pos
-            a_kills, b_kills = b_kills, a_kills
-
-        # Create scores
-        ms_a = MatchScore.objects.create(match=match, team=team_a, wins=1, position_points=a_pos, kill_points=a_kills)
-        ms_b = MatchScore.objects.create(match=match, team=team_b, wins=0, position_points=b_pos, kill_points=b_kills)
-
-        # Determine winner and mark completed
-        match.determine_winner()
-        match.status = 'completed'
-        match.save(update_fields=['status','winner'])
-
-        print(f"  Match {match.match_number}: {team_a.team_name} {ms_a.total_points} - {team_b.team_name} {ms_b.total_points} | Winner: {match.winner.team_name if match.winner else 'None'}")
-
-    # After all matches, determine group winner and mark completed
-    group.determine_group_winner()
-    group.status = 'completed'
-    group.save(update_fields=['status','winner'])
-    print(f"  Group winner: {group.winner.team_name if group.winner else 'None'}")
+# Simulate matches: give team A wins in most matches to deterministically produce winners.
+# Scores, match results and group results are accumulated across all groups and
+# written with one bulk_create / bulk_update each (two rows per match otherwise
+# means 2*M INSERT roundtrips plus an UPDATE per match and per group), and the
+# whole simulation commits once.
+with transaction.atomic():
+    all_scores = []
+    all_matches = []
+    updated_groups = []
+    for group in groups:
+        print(f"Simulating group: {group.group_name} | Teams: {[t.team_name for t in group.teams.all()]}")
+        matches = list(group.matches.all())  # prefetched, already ordered by match_number
+        teams = list(group.teams.all())
+        if len(teams) != 2:
+            print('Skipping non-2-team group')
+            continue
+        team_a = teams[0]
+        team_b = teams[1]
+
+        # Pre-generate the random columns in one choices() call each instead
+        # of four randint() calls per match
+        n = len(matches)
+        a_pos_col = random.choices(range(10, 26), k=n)
+        b_pos_col = random.choices(range(5, 21), k=n)
+        a_kills_col = random.choices(range(5, 16), k=n)
+        b_kills_col = random.choices(range(0, 11), k=n)
+
+        for match, a_pos, b_pos, a_kills, b_kills in zip(matches, a_pos_col, b_pos_col, a_kills_col, b_kills_col):
+            # Randomized but biased to team_a to ensure a winner
+            if b_pos + b_kills > a_pos + a_kills:
+                # swap to keep team_a winning mostly
+                a_pos, b_pos = b_pos, a_pos
+                a_kills, b_kills = b_kills, a_kills
+
+            # bulk_create skips MatchScore.save(), so set total_points here
+            all_scores.append(MatchScore(match=match, team=team_a, wins=1,
+                                         position_points=a_pos, kill_points=a_kills,
+                                         total_points=a_pos + a_kills))
+            all_scores.append(MatchScore(match=match, team=team_b, wins=0,
+                                         position_points=b_pos, kill_points=b_kills,
+                                         total_points=b_pos + b_kills))
+
+            # team_a always has the higher total after the swap above
+            match.winner = team_a
+            match.status = 'completed'
+
+            print(f"  Match {match.match_number}: {team_a.team_name} {a_pos + a_kills} - {team_b.team_name} {b_pos + b_kills} | Winner: {team_a.team_name}")
+
+        all_matches.extend(matches)
+
+        # team_a wins every match, so it is the group winner - no need to
+        # re-read completed matches via determine_group_winner()
+        group.winner = team_a
+        group.status = 'completed'
+        updated_groups.append(group)
+        print(f"  Group winner: {team_a.team_name}")
+
+    MatchScore.objects.bulk_create(all_scores, batch_size=500)
+    Match.objects.bulk_update(all_matches, ['status', 'winner'], batch_size=500)
+    Group.objects.bulk_update(updated_groups, ['status', 'winner'])
 
 # Calculate round scores
 TournamentGroupService.calculate_round_scores(tournament, 1)
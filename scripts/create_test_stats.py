@@ -1,3 +1,5 @@
+from django.db.models import Sum
+
 from accounts.models import Team, TeamStatistics
 
 team = Team.objects.first()
@@ -6,8 +8,12 @@ if not team:
 else:
     print(f"Using Team ID {team.id} - {team.name}")
 
+    # Fetch the team's stats once; every existence check below reads this
+    # dict instead of issuing its own SELECT
+    existing = {s.game_name: s for s in TeamStatistics.objects.filter(team=team)}
+
     def create_if_missing(game_name, t_wins, t_pos, t_kills, s_wins=0, s_pos=0, s_kills=0):
-        stat = TeamStatistics.objects.filter(team=team, game_name=game_name).first()
+        stat = existing.get(game_name)
         if stat:
             print(f"{game_name} stats already exist: {stat}")
             return stat
@@ -22,6 +28,7 @@ else:
             scrim_kill_points=s_kills,
         )
         stat.update_total_points()
+        existing[game_name] = stat
         print(f"Created {game_name} stats: {stat} (total_points={stat.total_points})")
         return stat
 
@@ -30,27 +37,24 @@ else:
     create_if_missing('BGMI', 10, 1500, 800, s_wins=5, s_pos=400, s_kills=200)
 
     # Create/ensure ALL aggregate exists
-    all_stat = TeamStatistics.objects.filter(team=team, game_name='ALL').first()
+    all_stat = existing.get('ALL')
     if not all_stat:
-        total_t_pos = sum([s.tournament_position_points for s in TeamStatistics.objects.filter(team=team).exclude(game_name='ALL')])
-        total_t_kills = sum([s.tournament_kill_points for s in TeamStatistics.objects.filter(team=team).exclude(game_name='ALL')])
-        total_scrim_pos = sum([s.scrim_position_points for s in TeamStatistics.objects.filter(team=team).exclude(game_name='ALL')])
-        total_scrim_kills = sum([s.scrim_kill_points for s in TeamStatistics.objects.filter(team=team).exclude(game_name='ALL')])
-        all_stat = TeamStatistics.objects.create(
-            team=team,
-            game_name='ALL',
-            tournament_wins=sum([s.tournament_wins for s in TeamStatistics.objects.filter(team=team).exclude(game_name='ALL')]),
-            tournament_position_points=total_t_pos,
-            tournament_kill_points=total_t_kills,
-            scrim_wins=sum([s.scrim_wins for s in TeamStatistics.objects.filter(team=team).exclude(game_name='ALL')]),
-            scrim_position_points=total_scrim_pos,
-            scrim_kill_points=total_scrim_kills,
+        # One DB-side aggregate instead of six SELECTs summed in Python
+        totals = TeamStatistics.objects.filter(team=team).exclude(game_name='ALL').aggregate(
+            tournament_wins=Sum('tournament_wins', default=0),
+            tournament_position_points=Sum('tournament_position_points', default=0),
+            tournament_kill_points=Sum('tournament_kill_points', default=0),
+            scrim_wins=Sum('scrim_wins', default=0),
+            scrim_position_points=Sum('scrim_position_points', default=0),
+            scrim_kill_points=Sum('scrim_kill_points', default=0),
         )
+        all_stat = TeamStatistics.objects.create(team=team, game_name='ALL', **totals)
+        existing['ALL'] = all_stat
         all_stat.update_total_points()
         print(f"Created ALL stats: {all_stat} (total_points={all_stat.total_points})")
     else:
         print(f"ALL stats already exist: {all_stat}")
 
     print('\nCurrent stats for team:')
-    for s in TeamStatistics.objects.filter(team=team):
+    for s in existing.values():
         print(f"- {s.game_name}: total_points={s.total_points}, tournament_wins={s.tournament_wins}")
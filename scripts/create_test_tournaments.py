@@ -23,8 +23,33 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "scrimverse.settings")
 django.setup()
 
+from django.db import transaction  # noqa: E402
+
 from accounts.models import HostProfile, User  # noqa: E402
-from tournaments.models import Tournament  # noqa: E402
+from tournaments.models import Group, Match, MatchScore, Tournament, TournamentRegistration  # noqa: E402
+
+# Per-plan / per-mode parameters, looked up instead of re-branching per event
+PRIZE_POOL = {"basic": 10000, "featured": 50000, "premium": 100000}
+ENTRY_FEE = {"basic": 100, "featured": 200, "premium": 500}
+MAX_PARTICIPANTS = {"SCRIM": 25, "TOURNAMENT": 100}
+ROUNDS = {
+    "SCRIM": [{"round": 1, "max_teams": 25, "qualifying_teams": 0}],
+    "TOURNAMENT": [
+        {"round": 1, "max_teams": 100, "qualifying_teams": 50},
+        {"round": 2, "max_teams": 50, "qualifying_teams": 20},
+        {"round": 3, "max_teams": 20, "qualifying_teams": 1},
+    ],
+}
+
+# (registration_start, registration_end, tournament_start) offsets from now,
+# in days, per (status, reg_status) scenario
+TIME_OFFSETS = {
+    ("upcoming", "not_started"): (2, 5, 7),  # registration starts in 2 days
+    ("upcoming", "open"): (-1, 3, 5),  # registration currently open
+    ("upcoming", "ended"): (-5, -1, 2),  # registration ended yesterday
+    ("ongoing", None): (-10, -5, -1),  # tournament started yesterday
+    ("completed", None): (-15, -10, -5),  # tournament ended 3 days ago
+}
 
 
 def get_or_create_host():
@@ -50,37 +75,21 @@ def get_or_create_host():
         return None
 
 
-def create_tournament(host, event_mode, plan_type, status, reg_status=None):
-    """Create a tournament with specific parameters."""
-    now = datetime.now()
+def build_tournament(host, event_mode, plan_type, status, reg_status=None, *, now):
+    """Build an unsaved Tournament with specific parameters (for bulk_create).
 
-    # Set up times based on status and registration status
-    if status == "upcoming":
-        if reg_status == "not_started":
-            # Registration starts in 2 days
-            reg_start = now + timedelta(days=2)
-            reg_end = now + timedelta(days=5)
-            tournament_start = now + timedelta(days=7)
-        elif reg_status == "open":
-            # Registration is currently open
-            reg_start = now - timedelta(days=1)
-            reg_end = now + timedelta(days=3)
-            tournament_start = now + timedelta(days=5)
-        else:  # ended
-            # Registration ended yesterday
-            reg_start = now - timedelta(days=5)
-            reg_end = now - timedelta(days=1)
-            tournament_start = now + timedelta(days=2)
-    elif status == "ongoing":
-        # Tournament started yesterday
-        reg_start = now - timedelta(days=10)
-        reg_end = now - timedelta(days=5)
-        tournament_start = now - timedelta(days=1)
-    else:  # completed
-        # Tournament ended 3 days ago
-        reg_start = now - timedelta(days=15)
-        reg_end = now - timedelta(days=10)
-        tournament_start = now - timedelta(days=5)
+    `now` is computed once by the caller so every event in a batch shares the
+    same reference time instead of drifting by microseconds per call.
+    """
+    # Set up times based on status and registration status; unknown upcoming
+    # reg_status values fall back to "ended", as the old if/elif chain did
+    key = (status, reg_status if status == "upcoming" else None)
+    if key not in TIME_OFFSETS:
+        key = ("upcoming", "ended")
+    reg_start_days, reg_end_days, start_days = TIME_OFFSETS[key]
+    reg_start = now + timedelta(days=reg_start_days)
+    reg_end = now + timedelta(days=reg_end_days)
+    tournament_start = now + timedelta(days=start_days)
 
     tournament_end = tournament_start + timedelta(hours=6)
 
@@ -89,27 +98,17 @@ def create_tournament(host, event_mode, plan_type, status, reg_status=None):
     status_name = reg_status.replace("_", " ").title() if reg_status else status.title()
     title = f"{plan_type.title()} {mode_name} - {status_name}"
 
-    # Set max participants based on event mode
-    max_participants = 25 if event_mode == "SCRIM" else 100
-
-    # Create rounds structure as JSON
-    if event_mode == "SCRIM":
-        rounds_data = [{"round": 1, "max_teams": max_participants, "qualifying_teams": 0}]
-    else:
-        rounds_data = [
-            {"round": 1, "max_teams": max_participants, "qualifying_teams": 50},
-            {"round": 2, "max_teams": 50, "qualifying_teams": 20},
-            {"round": 3, "max_teams": 20, "qualifying_teams": 1},
-        ]
+    max_participants = MAX_PARTICIPANTS[event_mode]
+    rounds_data = ROUNDS[event_mode]
 
     try:
-        tournament = Tournament.objects.create(
+        tournament = Tournament(
             host=host,
             title=title,
             game_name="BGMI",
             game_mode="Squad",
-            prize_pool=10000 if plan_type == "basic" else (50000 if plan_type == "featured" else 100000),
-            entry_fee=100 if plan_type == "basic" else (200 if plan_type == "featured" else 500),
+            prize_pool=PRIZE_POOL[plan_type],
+            entry_fee=ENTRY_FEE[plan_type],
             max_participants=max_participants,
             tournament_start=tournament_start,
             tournament_end=tournament_end,
@@ -145,54 +144,56 @@ def main():
 
     print(f"\n✓ Using host: {host.user.username}\n")
 
-    # Delete existing test tournaments
-    print("Cleaning up old test data...")
-    Tournament.objects.filter(host=host).delete()
-    print("✓ Cleaned up old test data\n")
+    # One reference time for the whole batch
+    now = datetime.now()
 
     plan_types = ["premium", "featured", "basic"]
     event_modes = [("TOURNAMENT", "Tournament"), ("SCRIM", "Scrim")]
-
-    created_count = 0
-
-    # Create tournaments for each scenario
+    scenarios = [
+        ("upcoming", "not_started"),
+        ("upcoming", "open"),
+        ("upcoming", "ended"),
+        ("ongoing", None),
+        ("completed", None),
+    ]
+
+    # Build every tournament in memory, then write them with one bulk_create
+    # (a single multi-VALUES INSERT on Postgres) instead of one INSERT per
+    # event. The cleanup delete and the insert commit together.
+    to_create = []
     for event_mode, mode_name in event_modes:
         print(f"\n{'─'*60}")
-        print(f"Creating {mode_name}s")
+        print(f"Building {mode_name}s")
         print(f"{'─'*60}\n")
 
         for plan_type in plan_types:
             print(f"\n  {plan_type.upper()} Plan:")
 
-            # UPCOMING - Registration Not Started
-            tournament = create_tournament(host, event_mode, plan_type, "upcoming", "not_started")
-            if tournament:
-                print(f"    ✓ Created: {tournament.title}")
-                created_count += 1
-
-            # UPCOMING - Registration Open
-            tournament = create_tournament(host, event_mode, plan_type, "upcoming", "open")
-            if tournament:
-                print(f"    ✓ Created: {tournament.title}")
-                created_count += 1
-
-            # UPCOMING - Registration Ended
-            tournament = create_tournament(host, event_mode, plan_type, "upcoming", "ended")
-            if tournament:
-                print(f"    ✓ Created: {tournament.title}")
-                created_count += 1
-
-            # ONGOING
-            tournament = create_tournament(host, event_mode, plan_type, "ongoing")
-            if tournament:
-                print(f"    ✓ Created: {tournament.title}")
-                created_count += 1
-
-            # COMPLETED
-            tournament = create_tournament(host, event_mode, plan_type, "completed")
-            if tournament:
-                print(f"    ✓ Created: {tournament.title}")
-                created_count += 1
+            for status, reg_status in scenarios:
+                tournament = build_tournament(host, event_mode, plan_type, status, reg_status, now=now)
+                if tournament:
+                    print(f"    ✓ Built: {tournament.title}")
+                    to_create.append(tournament)
+
+    with transaction.atomic():
+        # Delete existing test tournaments, deepest children first so each
+        # statement is a single bulk DELETE and the collector never has to
+        # materialize the match/score tree in Python. A plain _raw_delete on
+        # Tournament is off the table: the post_delete cache-invalidation
+        # signal must fire and Group/Match winner FKs are SET_NULL, both of
+        # which need Django's delete path.
+        print("\nCleaning up old test data...")
+        old = Tournament.objects.filter(host=host)
+        MatchScore.objects.filter(match__group__tournament__in=old).delete()
+        Match.objects.filter(group__tournament__in=old).delete()
+        Group.objects.filter(tournament__in=old).delete()
+        TournamentRegistration.objects.filter(tournament__in=old).delete()
+        old.delete()
+        print("✓ Cleaned up old test data")
+
+        Tournament.objects.bulk_create(to_create, batch_size=100)
+
+    created_count = len(to_create)
 
     print("\n" + "=" * 60)
     print(f"Summary: Created {created_count} test events")
@@ -13,6 +13,8 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "scrimverse.settings")
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 django.setup()
 
+from django.db import transaction
+
 from tournaments.models import Tournament
 from accounts.models import HostProfile
 
@@ -123,27 +125,34 @@ reg_end = now + timedelta(days=7)
 tournament_start = now + timedelta(days=8)
 tournament_end = now + timedelta(days=9)
 
-created_ids = []
-
-for data in tournaments_data:
-    tournament = Tournament.objects.create(
-        host=host,
-        title=data["title"],
-        game_name=data["game_name"],
-        game_mode=data["game_mode"],
-        description=data["description"],
-        entry_fee=data["entry_fee"],
-        max_participants=data["max_participants"],
-        prize_pool=data["prize_pool"],
-        registration_start=reg_start,
-        registration_end=reg_end,
-        tournament_start=tournament_start,
-        tournament_end=tournament_end,
-        status="upcoming",
-        rules="Standard tournament rules apply. Check-in required 15 minutes before start.",
+# One bulk INSERT inside one transaction instead of ten create() round-trips;
+# the database populates the PKs on the returned instances
+with transaction.atomic():
+    created = Tournament.objects.bulk_create(
+        [
+            Tournament(
+                host=host,
+                title=data["title"],
+                game_name=data["game_name"],
+                game_mode=data["game_mode"],
+                description=data["description"],
+                entry_fee=data["entry_fee"],
+                max_participants=data["max_participants"],
+                prize_pool=data["prize_pool"],
+                registration_start=reg_start,
+                registration_end=reg_end,
+                tournament_start=tournament_start,
+                tournament_end=tournament_end,
+                status="upcoming",
+                rules="Standard tournament rules apply. Check-in required 15 minutes before start.",
+            )
+            for data in tournaments_data
+        ]
     )
+
+created_ids = []
+for data, tournament in zip(tournaments_data, created):
     created_ids.append(tournament.id)
-    
     fee_str = f"INR {data['entry_fee']}" if data["entry_fee"] > 0 else "FREE"
     print(f"✓ Created: {data['game_name']} {data['game_mode']} ({tournament.id}) {fee_str}")
 
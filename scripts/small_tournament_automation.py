@@ -1,196 +1,19 @@
-import json
-import random
-import string
 from datetime import datetime, timedelta
 
-import requests
-
-BASE_URL = "http://127.0.0.1:8000/api"
-BANNER_IMAGE_PATH = "/Users/Sukruth30/Downloads/download.jpeg"
-
-# Meaningful team name components
-TEAM_PREFIXES = [
-    "Alpha",
-    "Beta",
-    "Gamma",
-    "Delta",
-    "Omega",
-    "Sigma",
-    "Phoenix",
-    "Dragon",
-    "Tiger",
-    "Wolf",
-    "Eagle",
-    "Falcon",
-    "Hawk",
-    "Raven",
-    "Viper",
-    "Cobra",
-    "Panther",
-    "Lion",
-    "Bear",
-    "Shark",
-    "Thunder",
-    "Lightning",
-    "Storm",
-    "Blaze",
-    "Inferno",
-    "Frost",
-    "Ice",
-    "Shadow",
-    "Ghost",
-    "Phantom",
-]
-
-TEAM_SUFFIXES = [
-    "Squad",
-    "Force",
-    "Legion",
-    "Battalion",
-    "Crew",
-    "Gang",
-    "Clan",
-    "Guild",
-    "Alliance",
-    "Warriors",
-    "Fighters",
-    "Hunters",
-    "Slayers",
-    "Guardians",
-    "Defenders",
-    "Champions",
-    "Heroes",
-    "Legends",
-    "Elites",
-    "Strikers",
-    "Raiders",
-    "Invaders",
-    "Conquerors",
-    "Dominators",
-    "Phantoms",
-    "Blazers",
-    "Storms",
-    "Aces",
-]
-
-PLAYER_FIRST_NAMES = [
-    "Shadow",
-    "Blaze",
-    "Storm",
-    "Frost",
-    "Venom",
-    "Titan",
-    "Phoenix",
-    "Dragon",
-    "Wolf",
-    "Eagle",
-    "Ghost",
-    "Phantom",
-    "Viper",
-    "Cobra",
-    "Thunder",
-    "Lightning",
-    "Nova",
-    "Nebula",
-    "Cosmic",
-    "Quantum",
-    "Steel",
-    "Iron",
-    "Chrome",
-    "Silver",
-    "Gold",
-    "Cyber",
-    "Neon",
-    "Pulse",
-    "Volt",
-    "Surge",
-    "Apex",
-    "Elite",
-    "Prime",
-    "Supreme",
-    "Legendary",
-    "Mythic",
-    "Epic",
-    "Heroic",
-    "Divine",
-    "Sacred",
-]
-
-PLAYER_LAST_NAMES = [
-    "Killer",
-    "Slayer",
-    "Hunter",
-    "Reaper",
-    "Destroyer",
-    "Master",
-    "Lord",
-    "King",
-    "Champion",
-    "Legend",
-    "Warrior",
-    "Fighter",
-    "Soldier",
-    "Shadow",
-    "Ghost",
-    "Phantom",
-    "Storm",
-    "Thunder",
-    "Lightning",
-    "Blaze",
-    "Steel",
-    "Iron",
-    "Wolf",
-    "Lion",
-    "Tiger",
-    "Eagle",
-    "Striker",
-    "Raider",
-    "Ace",
-    "Pro",
-]
-
-
-def random_email(prefix):
-    return f"{prefix}_{''.join(random.choices(string.ascii_lowercase, k=5))}@test.com"
-
-
-def generate_team_name():
-    """Generate a meaningful team name"""
-    prefix = random.choice(TEAM_PREFIXES)
-    suffix = random.choice(TEAM_SUFFIXES)
-    return f"{prefix} {suffix}"
-
-
-def generate_player_name():
-    """Generate a meaningful player username"""
-    first = random.choice(PLAYER_FIRST_NAMES)
-    last = random.choice(PLAYER_LAST_NAMES)
-    number = random.randint(1, 999)
-    return f"{first}{last}{number}"
-
-
-def register_host():
-    url = f"{BASE_URL}/accounts/host/register/"
-    random_suffix = "".join(random.choices(string.ascii_lowercase, k=5))
-    data = {
-        "email": random_email("host"),
-        "username": f"TestHost_{random_suffix}",
-        "password": "TestPass123!",
-        "password2": "TestPass123!",
-        "phone_number": "9999999999",
-    }
-    res = requests.post(url, json=data)
-    res = res.json()
-    print("Host Registered:", res["user"]["email"])
-    return res["tokens"]["access"], res["user"]
+from automation_common import batched, create_event
+from automation_common import create_player as _create_player
+from automation_common import (
+    create_team,
+    generate_player_name,
+    generate_team_name,
+    register_host,
+    register_team_to_tournament,
+)
 
 
 def create_tournament(token, game_mode, max_teams, title_suffix="", plan_type="basic"):
-    url = f"{BASE_URL}/tournaments/create/"
-    headers = {"Authorization": f"Bearer {token}"}
     now = datetime.now()
 
-    # Prepare form data
     data = {
         "title": f"Test Tournament - {game_mode}{title_suffix}",
         "description": f"Small test tournament for {game_mode} mode with {max_teams} teams.",
@@ -212,88 +35,14 @@ def create_tournament(token, game_mode, max_teams, title_suffix="", plan_type="b
         ],
     }
 
-    # Prepare multipart form data with banner image
-    files = {}
-    try:
-        with open(BANNER_IMAGE_PATH, "rb") as img:
-            files = {"banner_image": ("download.jpeg", img, "image/jpeg")}
-            form_data = data.copy()
-            form_data["rounds"] = json.dumps(data["rounds"])
-
-            res = requests.post(url, data=form_data, files=files, headers=headers)
-    except FileNotFoundError:
-        print(f"Warning: Banner image not found at {BANNER_IMAGE_PATH}, creating without banner")
-        res = requests.post(url, json=data, headers=headers)
-
-    res = res.json()
+    res = create_event(token, data)
     print(f"Tournament Created: {res['title']} | ID: {res['id']} | Mode: {game_mode} | Max Teams: {max_teams}")
     return res["id"]
 
 
 def create_player():
     """Create a single player with meaningful name and return their credentials"""
-    player_email = random_email("player")
-    url = f"{BASE_URL}/accounts/player/register/"
-    username = generate_player_name()
-
-    data = {
-        "email": player_email,
-        "username": username,
-        "password": "TestPass123!",
-        "password2": "TestPass123!",
-        "phone_number": "8888888888",
-    }
-    res = requests.post(url, json=data)
-
-    if res.status_code != 201:
-        print(f"ERROR: Failed to register player. Response: {res.text}")
-        return None
-
-    res_data = res.json()
-    return {
-        "email": player_email,
-        "username": res_data["user"]["username"],
-        "token": res_data["tokens"]["access"],
-        "id": res_data["user"]["id"],
-    }
-
-
-def create_team(captain_player, team_name, member_usernames):
-    """Create a team with the captain and members"""
-    url = f"{BASE_URL}/accounts/teams/"
-    headers = {"Authorization": f"Bearer {captain_player['token']}"}
-
-    data = {
-        "name": team_name,
-        "player_usernames": member_usernames,
-    }
-
-    res = requests.post(url, json=data, headers=headers)
-
-    if res.status_code == 201:
-        team_data = res.json()
-        return team_data["id"]
-    else:
-        print(f"  ❌ Failed to create team {team_name}: {res.text}")
-        return None
-
-
-def register_team_to_tournament(tournament_id, captain_player, team_id, save_as_team=True):
-    """Register an existing team to a tournament"""
-    register_url = f"{BASE_URL}/tournaments/{tournament_id}/register/"
-    headers = {"Authorization": f"Bearer {captain_player['token']}"}
-
-    reg_data = {
-        "team_id": team_id,
-        "save_as_team": save_as_team,
-    }
-
-    reg_response = requests.post(register_url, json=reg_data, headers=headers)
-    if reg_response.status_code == 201:
-        return True
-    else:
-        print(f"  ❌ Failed to register team: {reg_response.text}")
-        return False
+    return _create_player(generate_player_name())
 
 
 if __name__ == "__main__":
@@ -326,10 +75,8 @@ if __name__ == "__main__":
     registered_teams = []
     failed_teams = 0
 
-    for team_num in range(30):
-        # Get 4 players for this team
-        team_players = all_players[team_num * 4 : (team_num + 1) * 4]
-
+    # Chunk the player list into teams of 4 in one pass
+    for team_num, team_players in enumerate(batched(all_players, 4)):
         if len(team_players) < 4:
             print(f"  ⚠️ Not enough players for team {team_num + 1}")
             break
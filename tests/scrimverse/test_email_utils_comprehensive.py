@@ -1,8 +1,9 @@
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from scrimverse.email_utils import (
+    EmailService,
     send_password_reset_email,
     send_player_tournament_reminder_email,
     send_tournament_created_email,
@@ -10,6 +11,7 @@ from scrimverse.email_utils import (
     send_verification_email,
     send_welcome_email,
 )
+from scrimverse.tasks import enqueue_many
 
 
 @pytest.mark.django_db
@@ -64,6 +66,39 @@ def test_send_player_tournament_reminder_email(mock_send):
     mock_send.assert_called_once()
 
 
+@pytest.mark.django_db
+@patch("scrimverse.email_utils.send_bulk_email_task.delay")
+def test_send_bulk_email_queues_single_task(mock_delay):
+    recipients = [
+        {"email": "a@example.com", "user_name": "alpha"},
+        {"email": "b@example.com", "user_name": "bravo"},
+    ]
+    result = EmailService.send_bulk_email(
+        subject="Results are in!",
+        template_name="tournament_completed",
+        shared_context={"tournament_name": "My Tournament"},
+        per_recipient_contexts=recipients,
+    )
+    assert result is True
+    mock_delay.assert_called_once()
+    args, kwargs = mock_delay.call_args
+    assert kwargs["per_recipient_contexts"] == recipients
+
+
+def test_enqueue_many_shares_one_producer():
+    task = MagicMock()
+    argslist = [("a@example.com",), ("b@example.com",), ("c@example.com",)]
+    mock_pool = MagicMock()
+    with patch("scrimverse.tasks.app", **{"producer_pool": mock_pool}):
+        producer = mock_pool.acquire.return_value.__enter__.return_value
+        enqueue_many(task, argslist)
+    mock_pool.acquire.assert_called_once_with(block=True)
+    assert task.apply_async.call_count == 3
+    for call in task.apply_async.call_args_list:
+        assert call.kwargs["producer"] is producer
+        assert call.kwargs["queue"] == "emails"
+
+
 @pytest.mark.django_db
 @patch("scrimverse.email_utils.EmailService.send_email")
 def test_send_tournament_created_email(mock_send):
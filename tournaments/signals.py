@@ -1,9 +1,11 @@
 """
 Signal handlers for tournament cache invalidation
 """
+from django.conf import settings
 from django.core.cache import cache
-from django.db.models.signals import post_delete, post_save
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
+from django.utils import timezone
 
 from tournaments.models import Tournament, TournamentRegistration
 
@@ -14,6 +16,49 @@ def invalidate_tournament_cache_on_save(sender, instance, **kwargs):
     cache.delete("tournaments:list:all")
 
 
+@receiver(pre_save, sender=Tournament)
+def remember_scheduled_times(sender, instance, **kwargs):
+    """Stash the stored start/end so post_save can tell whether they moved"""
+    if instance.pk:
+        instance._old_schedule = (
+            sender.objects.filter(pk=instance.pk).values_list("tournament_start", "tournament_end").first()
+        )
+    else:
+        instance._old_schedule = None
+
+
+@receiver(post_save, sender=Tournament)
+def schedule_status_update_on_save(sender, instance, created, **kwargs):
+    """
+    Schedule the status sweep for the exact moments this tournament changes state
+
+    ETA tasks at tournament_start/tournament_end replace the old every-minute
+    beat poll. Tasks are queued on creation and again only when either time
+    actually moves - tournaments are saved on every registration, and blindly
+    rescheduling there would queue hundreds of duplicate sweeps per event. A
+    moved time leaves the old ETA task in place, but the sweep is a bulk
+    UPDATE, so the stale run is a harmless no-op. A 15-minute beat entry
+    remains as a safety net.
+    """
+    if getattr(settings, "CELERY_TASK_ALWAYS_EAGER", False):
+        # Eager mode can't honor ETAs - the safety-net beat covers dev
+        return
+
+    new_schedule = (instance.tournament_start, instance.tournament_end)
+    old_schedule = getattr(instance, "_old_schedule", None)
+    if not created and old_schedule == new_schedule:
+        return
+
+    from tournaments.tasks import update_tournament_statuses
+
+    now = timezone.now()
+    for eta in new_schedule:
+        if eta and eta > now:
+            # On an update, only the moved time needs a fresh task
+            if created or old_schedule is None or eta not in old_schedule:
+                update_tournament_statuses.apply_async(eta=eta)
+
+
 @receiver(post_delete, sender=Tournament)
 def invalidate_tournament_cache_on_delete(sender, instance, **kwargs):
     """Clear tournament list cache when a tournament is deleted"""
@@ -10,7 +10,6 @@ from django.db.models import Q, Sum
 from django.utils import timezone
 from django.db import IntegrityError
 
-from decouple import config
 from rest_framework import generics, parsers, permissions, status
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
@@ -763,7 +762,7 @@ class TournamentRegistrationInitiateView(APIView):
                             game_name=tournament.game_name,
                             start_date=tournament.tournament_start.strftime('%B %d, %Y at %I:%M %p'),
                             registration_id=str(registration.id),
-                            tournament_url=f"{config('CORS_ALLOWED_ORIGINS', default='http://localhost:3000').split(',')[0]}/tournaments/{tournament.id}",
+                            tournament_url=f"{settings.FRONTEND_BASE_URL}/tournaments/{tournament.id}",
                             team_name=registration.team_name,
                         )
                     except Exception as e:
@@ -782,7 +781,7 @@ class TournamentRegistrationInitiateView(APIView):
                                         game_name=tournament.game_name,
                                         start_date=tournament.tournament_start.strftime('%B %d, %Y at %I:%M %p'),
                                         registration_id=str(registration.id),
-                                        tournament_url=f"{config('CORS_ALLOWED_ORIGINS', default='http://localhost:3000').split(',')[0]}/tournaments/{tournament.id}",
+                                        tournament_url=f"{settings.FRONTEND_BASE_URL}/tournaments/{tournament.id}",
                                         team_name=registration.team_name,
                                     )
                                 except User.DoesNotExist:
@@ -1090,7 +1089,7 @@ class TournamentRegistrationCreateView(generics.CreateAPIView):
                     game_name=tournament.game_name,
                     start_date=tournament.tournament_start.strftime("%B %d, %Y at %I:%M %p"),
                     registration_id=str(registration.id),
-                    tournament_url=f"{config('CORS_ALLOWED_ORIGINS', default='http://localhost:3000').split(',')[0]}/tournaments/{tournament.id}",  # noqa: E501
+                    tournament_url=f"{settings.FRONTEND_BASE_URL}/tournaments/{tournament.id}",  # noqa: E501
                     team_name=registration.team_name,
                 )
 
@@ -1109,7 +1108,7 @@ class TournamentRegistrationCreateView(generics.CreateAPIView):
                                     game_name=tournament.game_name,
                                     start_date=tournament.tournament_start.strftime("%B %d, %Y at %I:%M %p"),
                                     registration_id=str(registration.id),
-                                    tournament_url=f"{config('CORS_ALLOWED_ORIGINS', default='http://localhost:3000').split(',')[0]}/tournaments/{tournament.id}",  # noqa: E501
+                                    tournament_url=f"{settings.FRONTEND_BASE_URL}/tournaments/{tournament.id}",  # noqa: E501
                                     team_name=registration.team_name,
                                 )
                             except User.DoesNotExist: